@@ -0,0 +1,196 @@
+"""
+Persistent Playwright browser with a pool of reusable BrowserContexts
+
+Launching Chromium costs seconds, while opening a context costs ~100 ms, so
+one browser is kept alive for the whole process and scrapes borrow contexts
+from it with acquire()/release() or "async with pool.context()". Released
+contexts are kept warm for reuse until they sit idle for longer than
+idle_timeout. The browser is relaunched automatically if it crashes or
+disconnects.
+
+Playwright objects are bound to the event loop that created them; if the pool
+is used from a different loop it starts over with a fresh browser.
+"""
+import asyncio
+import contextlib
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+# Try to import Playwright, but don't fail if it's not available
+try:
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    async_playwright = None
+    PLAYWRIGHT_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """
+    Bounded pool of BrowserContexts on a single shared Chromium instance
+
+    Args:
+        min_size (int): Contexts opened eagerly when the browser is launched
+        max_size (int): Maximum number of contexts in use at the same time
+        idle_timeout (float): Seconds an unused context is kept before it is closed
+        context_options (Dict, optional): Keyword arguments for browser.new_context
+        route_handler (Callable, optional): Handler installed on "**/*" for every new context
+        launch_args (List[str], optional): Extra Chromium command line flags
+    """
+
+    def __init__(
+        self,
+        min_size: int = 0,
+        max_size: int = 8,
+        idle_timeout: float = 300,
+        context_options: Optional[Dict] = None,
+        route_handler: Optional[Callable[..., Awaitable]] = None,
+        launch_args: Optional[List[str]] = None,
+    ):
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.context_options = context_options or {}
+        self.route_handler = route_handler
+        self.launch_args = launch_args or []
+
+        self.loop = None
+        self._pw = None
+        self._browser = None
+        self._lock = None
+        self._slots = None
+        self._idle: List[Tuple[object, float]] = []
+
+    def _bind_loop(self):
+        """(Re)initialise loop-bound state when used from a new event loop"""
+        loop = asyncio.get_running_loop()
+        if self.loop is not loop:
+            self._pw = None
+            self._browser = None
+            self._idle = []
+            self._lock = asyncio.Lock()
+            self._slots = asyncio.Semaphore(self.max_size)
+            self.loop = loop
+
+    async def _ensure_browser(self):
+        """Launch Chromium if it is not running (or has disconnected)"""
+        async with self._lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+
+            if self._browser is not None:
+                logger.warning("⚠️ Shared browser disconnected, relaunching")
+                self._idle = []
+                await self._stop_playwright()
+
+            logger.info("🚀 Launching shared Chromium browser")
+            self._pw = await async_playwright().start()
+            self._browser = await self._pw.chromium.launch(headless=True, args=self.launch_args)
+
+            for _ in range(min(self.min_size, self.max_size)):
+                self._idle.append((await self._new_context(), time.monotonic()))
+            return self._browser
+
+    async def _new_context(self):
+        """Open a context with the pool's options and route handler"""
+        context = await self._browser.new_context(**self.context_options)
+        if self.route_handler is not None:
+            await context.route("**/*", self.route_handler)
+        return context
+
+    async def _evict_idle(self):
+        """Close contexts that have been idle for longer than idle_timeout"""
+        cutoff = time.monotonic() - self.idle_timeout
+        expired = [context for context, released_at in self._idle if released_at < cutoff]
+        self._idle = [(context, released_at) for context, released_at in self._idle if released_at >= cutoff]
+        for context in expired:
+            await self._close_context(context)
+
+    async def acquire(self):
+        """
+        Borrow a BrowserContext, waiting if max_size contexts are already in use
+
+        Every acquire() must be paired with release(), typically in a finally block.
+        """
+        if not PLAYWRIGHT_AVAILABLE:
+            raise RuntimeError("Playwright is not installed")
+
+        self._bind_loop()
+        await self._slots.acquire()
+        try:
+            await self._ensure_browser()
+            await self._evict_idle()
+            if self._idle:
+                context, _ = self._idle.pop()
+                return context
+            return await self._new_context()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(self, context):
+        """Return a context to the pool, closing its pages; broken contexts are discarded"""
+        try:
+            for page in list(context.pages):
+                await page.close()
+            # A context from a browser that has since been relaunched would fail every later scrape
+            if (
+                self._browser is not None
+                and context.browser is self._browser
+                and self._browser.is_connected()
+            ):
+                self._idle.append((context, time.monotonic()))
+                context = None
+        except Exception as e:
+            logger.debug(f"Discarding browser context: {str(e)}")
+        finally:
+            if context is not None:
+                await self._close_context(context)
+            self._slots.release()
+
+    @contextlib.asynccontextmanager
+    async def context(self):
+        """Borrow a context for the duration of an "async with" block"""
+        context = await self.acquire()
+        try:
+            yield context
+        finally:
+            await self.release(context)
+
+    async def _close_context(self, context):
+        try:
+            await context.close()
+        except Exception as e:
+            logger.debug(f"Error closing browser context: {str(e)}")
+
+    async def _stop_playwright(self):
+        browser, pw = self._browser, self._pw
+        self._browser = None
+        self._pw = None
+        try:
+            if browser:
+                await browser.close()
+            if pw:
+                await pw.stop()
+        except Exception as e:
+            logger.debug(f"Error closing shared browser: {str(e)}")
+
+    @property
+    def is_running(self) -> bool:
+        return self._browser is not None
+
+    async def close(self):
+        """Close every pooled context, the browser and Playwright itself"""
+        idle, self._idle = self._idle, []
+        for context, _ in idle:
+            await self._close_context(context)
+        await self._stop_playwright()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
@@ -0,0 +1,156 @@
+"""
+Thin Redis-backed JSON cache for scraper responses
+
+Each entry is stored as a Redis hash holding the serialized value together with
+its generation timestamp and stale-at time. Entries are kept around for a grace
+period after going stale so callers can fall back to them when an upstream
+source fails. When Redis is not installed or REDIS_URL is not set, every lookup
+is a miss and writes are ignored.
+
+This is the persistent response cache for every upstream the scraper queries:
+NPI registry lookups, Healthgrades searches, Nominatim geocodes, WebMD listing
+pages and state-level scrapes, and merged doctor details. Each lookup uses its
+own key prefix (see make_key) and TTL, so entries survive restarts and are
+shared between workers.
+
+Redis calls are blocking, so coroutines should use get_json_async/set_json_async
+(and cached_async), which run them in a worker thread instead of on the loop.
+"""
+import asyncio
+import functools
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Optional
+
+import orjson
+
+# Try to import redis, but don't fail if it's not available
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_client = None
+_client_failed = False
+# Lookups run in worker threads, so the lazy connect must not race
+_client_lock = threading.Lock()
+
+
+def _get_client():
+    """Lazily connect to Redis using REDIS_URL; returns None when caching is disabled"""
+    global _client, _client_failed
+    if _client is not None or _client_failed:
+        return _client
+
+    with _client_lock:
+        if _client is not None or _client_failed:
+            return _client
+
+        redis_url = os.getenv("REDIS_URL")
+        if not REDIS_AVAILABLE or not redis_url:
+            _client_failed = True
+            return None
+
+        try:
+            client = redis.Redis.from_url(redis_url, socket_timeout=1, socket_connect_timeout=1)
+            client.ping()
+            _client = client
+            logger.info("Redis response cache enabled")
+        except Exception as e:
+            logger.warning(f"Redis cache unavailable, continuing without it: {str(e)}")
+            _client_failed = True
+    return _client
+
+
+def make_key(prefix: str, *parts: str) -> str:
+    """Build a stable cache key from the given parts"""
+    digest = hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+def get_json(key: str, allow_stale: bool = False) -> Optional[Any]:
+    """Return the cached value for key, or None on a miss (or a stale entry unless allow_stale)"""
+    client = _get_client()
+    if client is None:
+        return None
+
+    try:
+        value, stale_at = client.hmget(key, "value", "stale_at")
+        if value is None:
+            return None
+        if not allow_stale and stale_at is not None and float(stale_at) < time.time():
+            return None
+        return orjson.loads(value)
+    except Exception as e:
+        logger.debug(f"Cache read failed for {key}: {str(e)}")
+        return None
+
+
+def set_json(key: str, value: Any, ttl: int) -> None:
+    """Store value under key; it is considered fresh for ttl seconds"""
+    client = _get_client()
+    if client is None:
+        return
+
+    now = time.time()
+    grace = int(os.getenv("CACHE_STALE_GRACE", "604800"))
+    try:
+        pipe = client.pipeline()
+        pipe.hset(key, mapping={
+            "value": orjson.dumps(value),
+            "generated_at": now,
+            "stale_at": now + ttl,
+        })
+        pipe.expire(key, ttl + grace)
+        pipe.execute()
+    except Exception as e:
+        logger.debug(f"Cache write failed for {key}: {str(e)}")
+
+
+async def get_json_async(key: str, allow_stale: bool = False) -> Optional[Any]:
+    """get_json without blocking the event loop"""
+    return await asyncio.to_thread(get_json, key, allow_stale)
+
+
+async def set_json_async(key: str, value: Any, ttl: int) -> None:
+    """set_json without blocking the event loop"""
+    await asyncio.to_thread(set_json, key, value, ttl)
+
+
+def cached_async(key_func: Callable[..., str], ttl: int, is_usable: Callable[[Any], bool] = bool):
+    """
+    Cache the JSON result of an async function
+
+    Fresh hits are returned without calling the function. When the function
+    returns an unusable result (e.g. the upstream failed), a stale cached
+    value is returned instead if one exists. The undecorated function stays
+    reachable as __wrapped__ for callers that must see the live upstream.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = key_func(*args, **kwargs)
+            cached = await get_json_async(key)
+            if cached is not None:
+                logger.info(f"Cache hit for {func.__name__}")
+                return cached
+
+            value = await func(*args, **kwargs)
+            if is_usable(value):
+                await set_json_async(key, value, ttl)
+                return value
+
+            stale = await get_json_async(key, allow_stale=True)
+            if stale is not None:
+                logger.warning(f"Serving stale cached result for {func.__name__}")
+                return stale
+            return value
+        return wrapper
+    return decorator
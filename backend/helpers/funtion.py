@@ -1,19 +1,36 @@
-import requests
-import json
+import httpx
 import logging
-from typing import Dict, List, Optional
+import orjson
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 import re
-from bs4 import BeautifulSoup
-import time
+from rapidfuzz import process, fuzz
+from aiolimiter import AsyncLimiter
+from async_lru import alru_cache
+from cachetools import TTLCache
 from urllib.parse import quote, urljoin
 import os
 from dotenv import load_dotenv
 import traceback
 import asyncio
+import atexit
+import functools
+from collections import defaultdict
 import platform
-import sys
-import subprocess
+import threading
 import concurrent.futures
+from helpers.browser_pool import BrowserPool
+from helpers.cache import cached_async, get_json_async, make_key, set_json_async
+
+# Prefer selectolax's lexbor engine for WebMD pages; BeautifulSoup is only a fallback
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    LEXBOR_AVAILABLE = True
+except ImportError:
+    from bs4 import BeautifulSoup, SoupStrainer
+    LexborHTMLParser = None
+    LEXBOR_AVAILABLE = False
+    # Only the provider links are needed from WebMD search result pages
+    _PROV_STRAINER = SoupStrainer("a", class_="prov-name")
 
 # Try to import Playwright, but don't fail if it's not available
 try:
@@ -24,9 +41,109 @@ except ImportError:
     async_playwright = None
     PlaywrightTimeoutError = Exception
 
+# The import above already tells us whether Playwright can be used, and that never changes within a process
+_PLAYWRIGHT_USABLE = PLAYWRIGHT_AVAILABLE
+
+# Try to import pyahocorasick for single-pass state name detection
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
 # Load environment variables from .env file
 load_dotenv()
 
+# Cache lifetimes (seconds); NPI registry data is near-static, WebMD listings change more often
+NPI_TTL = int(os.getenv("NPI_TTL", "86400"))
+HEALTHGRADES_TTL = int(os.getenv("HEALTHGRADES_TTL", "86400"))
+WEBMD_TTL = int(os.getenv("WEBMD_TTL", "43200"))
+WEBMD_OVERVIEW_TTL = int(os.getenv("WEBMD_OVERVIEW_TTL", "3600"))
+WEBMD_SEARCH_TTL = int(os.getenv("WEBMD_SEARCH_TTL", "86400"))
+GEOCODE_TTL = int(os.getenv("GEOCODE_TTL", str(30 * 86400)))
+PLACES_TTL = int(os.getenv("PLACES_TTL", "86400"))
+
+# Nominatim's usage policy requires an identifying User-Agent
+NOMINATIM_USER_AGENT = os.getenv("NOMINATIM_USER_AGENT", "provider-verify/1.0")
+
+# States searched on WebMD when the address can't be resolved to one (at most 2)
+WEBMD_FALLBACK_STATES = [
+    s.strip() for s in os.getenv("WEBMD_FALLBACK_STATES", "idaho,california").split(",") if s.strip()
+][:2]
+
+# In-process Google Places caches: (name, specialty) -> place_id and place_id -> details result.
+# Practice metadata changes slowly, so a day is a safe default; bounded to avoid unbounded growth.
+_PLACES_TEXT_CACHE = TTLCache(maxsize=4096, ttl=PLACES_TTL)
+_PLACES_DETAILS_CACHE = TTLCache(maxsize=4096, ttl=PLACES_TTL)
+
+# In-process geocoding results by normalized address, in front of the Redis copy
+_GEOCODE_CACHE = TTLCache(maxsize=4096, ttl=GEOCODE_TTL)
+
+# Token buckets (requests per second) per upstream, so a throttled service never holds up the others
+_PLACES_LIMITER = AsyncLimiter(float(os.getenv("PLACES_RATE_LIMIT", "10")), 1)
+_NPI_LIMITER = AsyncLimiter(float(os.getenv("NPI_RATE_LIMIT", "10")), 1)
+_HEALTHGRADES_LIMITER = AsyncLimiter(float(os.getenv("HEALTHGRADES_RATE_LIMIT", "5")), 1)
+_WEBMD_API_LIMITER = AsyncLimiter(float(os.getenv("WEBMD_API_RATE_LIMIT", "5")), 1)
+# Nominatim's usage policy allows at most one request per second, so this one is not configurable
+_NOMINATIM_LIMITER = AsyncLimiter(1, 1)
+
+# Requests currently being made, keyed like the caches, so concurrent callers can share them
+_INFLIGHT: Dict[tuple, asyncio.Future] = {}
+
+class _LeaderCancelled(Exception):
+    """Set on a shared request when the caller running it was cancelled; waiters retry instead"""
+
+async def _coalesced(key: tuple, fetch: Callable[[], Awaitable]):
+    """Await an in-flight request for key if there is one, otherwise run fetch() and share its outcome"""
+    while True:
+        future = _INFLIGHT.get(key)
+        if future is None:
+            break
+        try:
+            # Shielded so a cancelled waiter doesn't cancel the request for everyone else
+            return await asyncio.shield(future)
+        except _LeaderCancelled:
+            # Whoever ran the request went away; start (or join) a fresh one
+            continue
+    
+    future = asyncio.get_running_loop().create_future()
+    _INFLIGHT[key] = future
+    try:
+        result = await fetch()
+    except asyncio.CancelledError:
+        # Only this caller was cancelled; waiters get a normal exception and re-run the fetch
+        future.set_exception(_LeaderCancelled())
+        future.exception()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Mark as retrieved: with no other waiters asyncio would log it as unhandled
+        future.exception()
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        if _INFLIGHT.get(key) is future:
+            del _INFLIGHT[key]
+
+# Upper bound (seconds) on one blocking get_doctor_details call; WebMD alone may take up to 180s
+DOCTOR_LOOKUP_TIMEOUT = float(os.getenv("DOCTOR_LOOKUP_TIMEOUT", "240"))
+
+# Pages used in parallel for the insurance checks of one profile (each loads the profile once)
+INSURANCE_CHECK_PAGES = int(os.getenv("WEBMD_INSURANCE_PAGES", "3"))
+
+# Upper bound on WebMD search-result tabs open at once across all scrapes
+MAX_PARALLEL_PAGES = int(os.getenv("WEBMD_MAX_PARALLEL_PAGES", "3"))
+
+# Optional JSON endpoint behind WebMD's search listings, tried before rendering pages.
+# A format string with {specialty}, {state} and {page} placeholders; unset disables it.
+WEBMD_API_URL = os.getenv("WEBMD_API_URL", "")
+
+# The same endpoint up to its first placeholder or query string; search pages call it for their listings
+_WEBMD_LISTINGS_PREFIX = re.split(r"[{?]", WEBMD_API_URL, maxsplit=1)[0]
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -37,16 +154,525 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+_PHONE_RE = re.compile(r'\(\d{3}\)\s*\d{3}-\d{4}')
+
+# Preference order for NPI address purposes (higher wins)
+_NPI_ADDRESS_PRIORITY = {"LOCATION": 2, "MAILING": 1}
+
+# Map state abbreviations to full state names (URL format with hyphens)
+_STATE_ABBREV_TO_NAME = {
+    'AL': 'alabama', 'AK': 'alaska', 'AZ': 'arizona', 'AR': 'arkansas', 'CA': 'california',
+    'CO': 'colorado', 'CT': 'connecticut', 'DE': 'delaware', 'FL': 'florida', 'GA': 'georgia',
+    'HI': 'hawaii', 'ID': 'idaho', 'IL': 'illinois', 'IN': 'indiana', 'IA': 'iowa',
+    'KS': 'kansas', 'KY': 'kentucky', 'LA': 'louisiana', 'ME': 'maine', 'MD': 'maryland',
+    'MA': 'massachusetts', 'MI': 'michigan', 'MN': 'minnesota', 'MS': 'mississippi', 'MO': 'missouri',
+    'MT': 'montana', 'NE': 'nebraska', 'NV': 'nevada', 'NH': 'new-hampshire', 'NJ': 'new-jersey',
+    'NM': 'new-mexico', 'NY': 'new-york', 'NC': 'north-carolina', 'ND': 'north-dakota', 'OH': 'ohio',
+    'OK': 'oklahoma', 'OR': 'oregon', 'PA': 'pennsylvania', 'RI': 'rhode-island', 'SC': 'south-carolina',
+    'SD': 'south-dakota', 'TN': 'tennessee', 'TX': 'texas', 'UT': 'utah', 'VT': 'vermont',
+    'VA': 'virginia', 'WA': 'washington', 'WV': 'west-virginia', 'WI': 'wisconsin', 'WY': 'wyoming'
+}
+
+# Map full state names to URL format
+_STATE_NAMES = {
+    'alabama': 'alabama', 'alaska': 'alaska', 'arizona': 'arizona', 'arkansas': 'arkansas', 'california': 'california',
+    'colorado': 'colorado', 'connecticut': 'connecticut', 'delaware': 'delaware', 'florida': 'florida', 'georgia': 'georgia',
+    'hawaii': 'hawaii', 'idaho': 'idaho', 'illinois': 'illinois', 'indiana': 'indiana', 'iowa': 'iowa',
+    'kansas': 'kansas', 'kentucky': 'kentucky', 'louisiana': 'louisiana', 'maine': 'maine', 'maryland': 'maryland',
+    'massachusetts': 'massachusetts', 'michigan': 'michigan', 'minnesota': 'minnesota', 'mississippi': 'mississippi', 'missouri': 'missouri',
+    'montana': 'montana', 'nebraska': 'nebraska', 'nevada': 'nevada', 'new hampshire': 'new-hampshire', 'new jersey': 'new-jersey',
+    'new mexico': 'new-mexico', 'new york': 'new-york', 'north carolina': 'north-carolina', 'north dakota': 'north-dakota', 'ohio': 'ohio',
+    'oklahoma': 'oklahoma', 'oregon': 'oregon', 'pennsylvania': 'pennsylvania', 'rhode island': 'rhode-island', 'south carolina': 'south-carolina',
+    'south dakota': 'south-dakota', 'tennessee': 'tennessee', 'texas': 'texas', 'utah': 'utah', 'vermont': 'vermont',
+    'virginia': 'virginia', 'washington': 'washington', 'west virginia': 'west-virginia', 'wisconsin': 'wisconsin', 'wyoming': 'wyoming'
+}
+
+_STATE_ABBREV_RE = re.compile(r'\b[A-Z]{2}\b')
+
+# Name normalization: title, degree suffixes (dotted or not) and punctuation
+_NORM_RE = re.compile(r"\bdr\b\.?|\b(?:m\.?d|d\.?o|ph\.?d|d\.?d\.?s)\b\.?|[.,]")
+_WS_RE = re.compile(r"\s+")
+
+# Strips markup so insurance verdicts are matched against page text only
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Phrases WebMD shows when it cannot confirm a carrier, as one alternation
+_REJECTION_RE = re.compile(
+    r"cannot verify|not verified|contact.*provider.*to confirm|you should contact the provider",
+    re.IGNORECASE,
+)
+
+# Compiled acceptance pattern per carrier, filled lazily by _get_patterns
+_INSURANCE_RE_CACHE: Dict[str, Tuple[re.Pattern, re.Pattern]] = {}
+
+def _get_patterns(insurance_name: str) -> Tuple[re.Pattern, re.Pattern]:
+    """Return (acceptance, rejection) regexes for a carrier, compiling them on first use"""
+    patterns = _INSURANCE_RE_CACHE.get(insurance_name)
+    if patterns is None:
+        escaped = re.escape(insurance_name.lower())
+        # "dr ... accepts <carrier>" is covered by the plain "accepts" branch
+        acceptance = re.compile(f"accepts.*{escaped}|{escaped}.*(?:accepted|participating)", re.IGNORECASE)
+        patterns = _INSURANCE_RE_CACHE[insurance_name] = (acceptance, _REJECTION_RE)
+    return patterns
+
+# Fallback selectors for each field of a WebMD profile page, tried in order
+_PROFILE_NAME_SELECTORS = (
+    "h1",
+    ".provider-name",
+    ".doctor-name",
+    "[data-testid='provider-name']",
+    ".profile-header h1",
+)
+_PROFILE_SPECIALTY_SELECTORS = (
+    "div.Specialty",
+    ".specialty",
+    "[data-testid='specialty']",
+    ".provider-specialty",
+    ".doctor-specialty",
+    ".profile-specialty",
+)
+_PROFILE_ADDRESSES_SELECTORS = (
+    "address",
+    ".address",
+    "[data-testid='address']",
+    ".provider-address",
+    ".location-address",
+)
+_PROFILE_PHONES_SELECTORS = (
+    "a[href^='tel']",
+    ".phone",
+    "[data-testid='phone']",
+    ".provider-phone",
+    ".contact-phone",
+)
+_PROFILE_INSURANCE_ACCEPTED_SELECTORS = (
+    "li[data-testid='insurance-item']",
+    ".insurance-item",
+    ".insurance-plan",
+    ".accepted-insurance li",
+    ".insurance-list li",
+)
+_PROFILE_LANGUAGES_SELECTORS = (
+    "li[data-testid='language-item']",
+    ".language-item",
+    ".languages li",
+    ".provider-languages li",
+)
+_PROFILE_RATING_SELECTORS = (
+    "span.RatingValue",
+    ".rating-value",
+    "[data-testid='rating']",
+    ".provider-rating",
+    ".star-rating",
+)
+
+def _parse_search_results(content: str) -> List[Dict]:
+    """Extract {"name", "url"} entries from a WebMD search results page"""
+    # ✅ USE CORRECT SELECTOR from POC code
+    if LEXBOR_AVAILABLE:
+        tree = LexborHTMLParser(content)
+        providers = [(a.text(strip=True), a.attributes.get("href")) for a in tree.css("a.prov-name")]
+    else:
+        soup = BeautifulSoup(content, "lxml", parse_only=_PROV_STRAINER)
+        providers = [(a.get_text(strip=True), a.get("href")) for a in soup.find_all("a", class_="prov-name")]
+    
+    # Keyed by URL so a provider listed twice on the page is kept once
+    doctors = {}
+    for name, href in providers:
+        if not name or not href:
+            continue
+        
+        # Ensure href is a full URL
+        if href.startswith('/'):
+            href = f"https://doctor.webmd.com{href}"
+        elif not href.startswith('http'):
+            href = f"https://doctor.webmd.com/{href}"
+        
+        url = href.partition("?")[0]  # Remove query parameters
+        if url not in doctors:
+            doctors[url] = {"name": name, "url": url}
+    return list(doctors.values())
+
+# Field -> (fallback selectors, collect every match) for the in-browser profile extraction
+_PROFILE_FIELDS = {
+    "name": (_PROFILE_NAME_SELECTORS, False),
+    "specialty": (_PROFILE_SPECIALTY_SELECTORS, False),
+    "addresses": (_PROFILE_ADDRESSES_SELECTORS, True),
+    "phones": (_PROFILE_PHONES_SELECTORS, True),
+    "insurance_accepted": (_PROFILE_INSURANCE_ACCEPTED_SELECTORS, True),
+    "languages": (_PROFILE_LANGUAGES_SELECTORS, True),
+    "rating": (_PROFILE_RATING_SELECTORS, False),
+}
+
+# Runs in the page: for each field, the first selector with a non-empty match wins
+_EXTRACT_PROFILE_JS = """
+fields => {
+    const text = e => (e.textContent || "").replace(/\\s+/g, " ").trim();
+    const out = {};
+    for (const [field, [selectors, many]] of Object.entries(fields)) {
+        out[field] = many ? [] : null;
+        for (const selector of selectors) {
+            if (many) {
+                const values = [...document.querySelectorAll(selector)].map(text);
+                if (values.length) { out[field] = values; break; }
+            } else {
+                const el = document.querySelector(selector);
+                const value = el && text(el);
+                if (value) { out[field] = value; break; }
+            }
+        }
+    }
+    return out;
+}
+"""
+
+def _parse_healthgrades_card(content: str) -> Optional[Tuple[Optional[str], Optional[str]]]:
+    """Return (phone, address) from the first provider card of a Healthgrades search page, or None"""
+    if LEXBOR_AVAILABLE:
+        # Lexbor returns grouped-selector matches in document order, like find_all
+        card = LexborHTMLParser(content).css_first(
+            'div[class*=provider], div[class*=doctor], div[class*=listing], '
+            'article[class*=provider], article[class*=doctor], article[class*=listing]'
+        )
+        if card is None:
+            return None
+        card_text = card.text(separator=' ', strip=True)
+        address_element = card.css_first(
+            'span[class*=address], span[class*=location], div[class*=address], div[class*=location]'
+        )
+        address = address_element.text(strip=True) if address_element else None
+    else:
+        soup = BeautifulSoup(content, "lxml")
+        card = soup.find(['div', 'article'], class_=re.compile(r'provider|doctor|listing'))
+        if card is None:
+            return None
+        card_text = card.get_text(separator=' ', strip=True)
+        address_element = card.find(['span', 'div'], class_=re.compile(r'address|location'))
+        address = address_element.get_text(strip=True) if address_element else None
+    
+    # One search over the card's text for the phone number
+    phone_match = _PHONE_RE.search(card_text)
+    return (phone_match.group(0) if phone_match else None), address
+
+def _providers_from_payload(payload) -> List[Dict]:
+    """Extract {"name", "url"} entries from a WebMD search JSON payload; raises ValueError on other shapes"""
+    providers = payload.get("results", payload.get("providers")) if isinstance(payload, dict) else payload
+    if not isinstance(providers, list):
+        raise ValueError("unexpected WebMD API payload")
+    
+    doctors = {}
+    for provider in providers:
+        name = provider.get("name") or provider.get("fullName")
+        href = provider.get("url") or provider.get("profileUrl")
+        if name and href:
+            url = urljoin("https://doctor.webmd.com/", href).partition("?")[0]
+            doctors.setdefault(url, {"name": name, "url": url})
+    return list(doctors.values())
+
+def _is_provider_json_response(response) -> bool:
+    """Match the listings XHR of a WebMD search page (the endpoint configured in WEBMD_API_URL)"""
+    return (
+        bool(_WEBMD_LISTINGS_PREFIX)
+        and response.url.startswith(_WEBMD_LISTINGS_PREFIX)
+        and response.request.resource_type in ("xhr", "fetch")
+        and "json" in response.headers.get("content-type", "")
+    )
+
+def _consume_outcome(future: asyncio.Future) -> None:
+    """Done callback that marks a background wait's exception as retrieved"""
+    if not future.cancelled():
+        future.exception()
+
+def _build_state_automaton():
+    """Build an Aho-Corasick automaton over full state names for single-pass detection"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for state_name, state_url_format in _STATE_NAMES.items():
+        automaton.add_word(state_name, (state_name, state_url_format))
+    automaton.make_automaton()
+    return automaton
+
+_STATE_AUTOMATON = _build_state_automaton()
+
+def _find_state_names(address_lower: str) -> List:
+    """Return (state_name, url_format) pairs for every full state name found in the address"""
+    if _STATE_AUTOMATON is not None:
+        return [match for _, match in _STATE_AUTOMATON.iter(address_lower)]
+    return [(name, url) for name, url in _STATE_NAMES.items() if name in address_lower]
+
+def _split_name(name: str):
+    """Split a doctor name ("First Last" or "Last, First") into (first_name, last_name)"""
+    if "," in name:
+        last_name, first_name = [n.strip() for n in name.split(",", 1)]
+    else:
+        parts = name.strip().split()
+        first_name = parts[0] if parts else ""
+        last_name = " ".join(parts[1:]) if len(parts) > 1 else ""
+    return first_name, last_name
+
+def _empty_doctor_info(name: str, specialty: str) -> Dict:
+    """Result skeleton shared by successful and failed lookups, so every result has the same keys"""
+    return {
+        "name": name,
+        "specialty": specialty,
+        "address": None,
+        "phone_number": None,
+        "license_number": None,
+        "affiliated_insurance_networks": [],
+        "services_offered": [],
+        "npi_data": {},
+        "practice_locations": [],
+        "credentials": [],
+        "scraped_sources": []
+    }
+
+def _doctor_details_cache_key(scraper, name: str, specialty: str, address: str = None) -> str:
+    state = scraper._extract_state_from_address(address) if address else None
+    return make_key("doc", scraper._normalize_name(name), (specialty or "").lower(), state or "")
+
+def _npi_cache_key(scraper, client, name: str, specialty: str) -> str:
+    first_name, last_name = _split_name(name)
+    return make_key("npi", first_name.lower(), last_name.lower(), (specialty or "").lower())
+
+def _healthgrades_cache_key(scraper, client, name: str, specialty: str) -> str:
+    return make_key("healthgrades", scraper._normalize_name(name), (specialty or "").lower())
+
+def _new_scraper_loop() -> asyncio.AbstractEventLoop:
+    """Create the event loop for the scraper thread (Proactor on Windows so Playwright can spawn its driver)"""
+    if platform.system() == "Windows":
+        return asyncio.ProactorEventLoop()
+    return asyncio.new_event_loop()
+
+# One persistent loop in a background thread runs all Playwright work, so
+# browser state survives between calls instead of dying with each asyncio.run
+_LOOP = _new_scraper_loop()
+threading.Thread(target=_LOOP.run_forever, name="scraper-loop", daemon=True).start()
+
+def _submit(coro) -> concurrent.futures.Future:
+    """Schedule a coroutine on the shared scraper loop"""
+    return asyncio.run_coroutine_threadsafe(coro, _LOOP)
+
+# HTTP transport policy for every upstream: one pooled HTTP/2 client, connection retries in the
+# transport, and status retries with backoff in _get_with_retries
+
+# Split connect/read timeouts so an unreachable host fails fast
+_HTTP_TIMEOUT = httpx.Timeout(8, connect=2)
+
+# Keep-alive pool shared by all upstreams
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=85)
+
+# Upstream statuses worth retrying with backoff
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_HTTP_CLIENT = None
+
+def _get_http_client() -> "httpx.AsyncClient":
+    """Return the process-wide HTTP/2 client; only use it from coroutines running on _LOOP"""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            timeout=_HTTP_TIMEOUT,
+            headers=DEFAULT_HEADERS,
+            # Transport-level retries cover connection errors; status retries are in _get_with_retries
+            transport=httpx.AsyncHTTPTransport(http2=True, retries=2, limits=_HTTP_LIMITS),
+        )
+    return _HTTP_CLIENT
+
+async def _get_with_retries(client: "httpx.AsyncClient", url: str, retries: int = 3,
+                            backoff_factor: float = 0.5, limiter: Optional[AsyncLimiter] = None,
+                            **kwargs) -> "httpx.Response":
+    """GET url, retrying retryable statuses with exponential backoff and honouring Retry-After"""
+    for attempt in range(retries + 1):
+        # Every attempt, retries included, spends a token from the upstream's bucket
+        if limiter is not None:
+            await limiter.acquire()
+        response = await client.get(url, **kwargs)
+        if response.status_code not in _RETRY_STATUSES or attempt == retries:
+            return response
+        
+        delay = backoff_factor * (2 ** attempt)
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = max(delay, float(retry_after))
+        logger.warning(f"{url} returned {response.status_code}, retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+    return response
+
+_BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "other"}
+
+# Trackers and ad beacons keep the network busy without contributing any content
+_BLOCKED_HOSTS_RE = re.compile(
+    r"^https?://[^/]*(?:google-analytics\.com|googletagmanager\.com|doubleclick\.net"
+    r"|scorecardresearch\.com|googlesyndication\.com|adservice\.google\.com)[:/]"
+)
+
+# Profile pages host the insurance widget, whose input is located by visibility,
+# so their stylesheets are kept; everywhere else CSS is dropped as well
+_STYLED_PAGE_RE = re.compile(r"^https://doctor\.webmd\.com/doctor/")
+
+def _frame_url(request) -> str:
+    try:
+        return request.frame.url
+    except Exception:
+        return ""
+
+async def _block_heavy_resources(route):
+    """Playwright route handler that aborts requests for resources the scraper never reads"""
+    request = route.request
+    resource_type = request.resource_type
+    if resource_type in _BLOCKED_RESOURCE_TYPES or _BLOCKED_HOSTS_RE.match(request.url) or (
+        resource_type == "stylesheet" and not _STYLED_PAGE_RE.match(_frame_url(request))
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+# Shared by every _scrape_single_page call (all of which run on _LOOP)
+_PAGE_SEMAPHORE = asyncio.Semaphore(MAX_PARALLEL_PAGES)
+
+# Locator strategies for the profile's insurance widget, most specific first
+_INSURANCE_INPUT_SELECTORS = (
+    "xpath=/html/body/div[1]/main/div[4]/div[19]/div/div[2]/div/div/div[1]/div/div/div[1]/div[1]/input",
+    'input.webmd-input__inner[placeholder="Enter Insurance Carrier"]',
+)
+_INSURANCE_BUTTON_SELECTORS = (
+    "xpath=//*[@id='insurance']/div/div[2]/div/div/div[1]/div/div/div[3]/button",
+)
+
+# Clears the carrier input and notifies the widget, so the next check starts from a blank state
+_RESET_INSURANCE_INPUT_JS = """
+() => {
+    const input = document.querySelector('input.webmd-input__inner');
+    if (input) {
+        input.value = '';
+        input.dispatchEvent(new Event('input', { bubbles: true }));
+    }
+}
+"""
+
+# Counts DOM mutations in or of div.verify-text, so a re-rendered verdict is noticed even when its
+# text is identical to the previous carrier's; installs the observer once per page and returns the count
+_WATCH_VERIFY_TEXT_JS = """
+() => {
+    if (!window.__verifyTextObserver) {
+        window.__verifyTextMutations = 0;
+        const inVerify = n => {
+            const el = n.nodeType === 1 ? n : n.parentElement;
+            return !!(el && el.closest('div.verify-text'));
+        };
+        const hasVerify = n => n.nodeType === 1 && (n.matches('div.verify-text') || !!n.querySelector('div.verify-text'));
+        window.__verifyTextObserver = new MutationObserver(records => {
+            for (const r of records) {
+                if (inVerify(r.target) || [...r.addedNodes, ...r.removedNodes].some(hasVerify)) {
+                    window.__verifyTextMutations++;
+                }
+            }
+        });
+        window.__verifyTextObserver.observe(document.body, { childList: true, subtree: true, characterData: true });
+    }
+    return window.__verifyTextMutations;
+}
+"""
+
+# True once a verdict was rendered after the submit, or some verify-text newly names the carrier
+_VERIFY_TEXT_UPDATED_JS = """
+([before, carrier, previous]) => {
+    const texts = [...document.querySelectorAll('div.verify-text')]
+        .map(e => (e.textContent || '').trim())
+        .filter(Boolean);
+    return (window.__verifyTextMutations > before && texts.length > 0)
+        || texts.some(text => !previous.includes(text) && text.toLowerCase().includes(carrier));
+}
+"""
+
+# The selector that last resolved for each widget part, tried first (with a short timeout) next time
+_LAST_WORKING = {"input": None, "button": None}
+
+async def _find_visible_locator(page, part: str, selectors: Tuple[str, ...]):
+    """Return the first visible locator among selectors, preferring the one that worked last time"""
+    last = _LAST_WORKING.get(part)
+    if last:
+        locator = page.locator(last).first
+        try:
+            await locator.wait_for(state="visible", timeout=1500)
+            return locator
+        except Exception:
+            _LAST_WORKING[part] = None
+    
+    for selector in selectors:
+        if selector == last:
+            continue
+        locator = page.locator(selector).first
+        try:
+            await locator.wait_for(state="visible", timeout=5000)
+        except Exception:
+            continue
+        _LAST_WORKING[part] = selector
+        return locator
+    return None
+
+# One Chromium for the whole process; each scrape borrows a context from the pool
+_BROWSER_POOL = BrowserPool(
+    max_size=int(os.getenv("WEBMD_MAX_CONTEXTS", "8")),
+    context_options={
+        "user_agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/121.0.0.0 Safari/537.36"
+        ),
+        "locale": "en-US",
+        "viewport": {"width": 1920, "height": 1080},
+    },
+    # Only the DOM is parsed, so skip downloading images, fonts, media and (mostly) CSS.
+    # JavaScript stays enabled: WebMD listings are lazy-loaded client side.
+    route_handler=_block_heavy_resources,
+    launch_args=["--disable-blink-features=AutomationControlled"],
+)
+
+def _shutdown_playwright():
+    """atexit hook: close the shared browser if its event loop is still usable"""
+    loop = _BROWSER_POOL.loop
+    if not _BROWSER_POOL.is_running or loop is None or loop.is_closed():
+        return
+    try:
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(_BROWSER_POOL.close(), loop).result(10)
+        else:
+            loop.run_until_complete(_BROWSER_POOL.close())
+    except Exception as e:
+        logger.debug(f"Playwright shutdown failed: {str(e)}")
+
+atexit.register(_shutdown_playwright)
+
 class DoctorInfoScraper:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
     def get_doctor_details(self, name: str, specialty: str, address: str = None) -> Dict:
+        """
+        Synchronous wrapper around get_doctor_details_async for existing callers
+        
+        Blocks until the lookup finishes on the shared scraper loop, for at most
+        DOCTOR_LOOKUP_TIMEOUT seconds; a lookup that overruns is cancelled and an
+        empty result is returned.
+        """
+        future = _submit(self._get_doctor_details(name, specialty, address))
+        try:
+            return future.result(timeout=DOCTOR_LOOKUP_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            logger.error(f"⏱️ Lookup for {name} timed out after {DOCTOR_LOOKUP_TIMEOUT:.0f} seconds")
+            return _empty_doctor_info(name, specialty)
+
+    async def get_doctor_details_async(self, name: str, specialty: str, address: str = None) -> Dict:
         """
         Main function to get comprehensive doctor details from multiple sources
         
+        The lookup runs on the shared scraper loop (which owns the HTTP client and
+        Playwright browser) and can be awaited from any event loop.
+        
         Args:
             name (str): Doctor's full name
             specialty (str): Doctor's specialty/specialization
@@ -55,23 +681,36 @@ class DoctorInfoScraper:
         Returns:
             Dict: Comprehensive doctor information
         """
+        return await asyncio.wrap_future(_submit(self._get_doctor_details(name, specialty, address)))
+
+    @cached_async(_doctor_details_cache_key, ttl=WEBMD_TTL, is_usable=lambda info: bool(info.get("scraped_sources")))
+    async def _get_doctor_details(self, name: str, specialty: str, address: str = None) -> Dict:
+        """
+        Gather doctor details from all sources; must run on _LOOP
+        
+        NPI Registry, Healthgrades and the State Medical Board are independent
+        and are fetched concurrently; WebMD runs once the best address is known.
+        Results are cached in Redis (when configured) for WEBMD_TTL seconds.
+        """
         logger.info(f"Starting search for Dr. {name} - Specialty: {specialty}")
         
-        doctor_info = {
-            "name": name,
-            "specialty": specialty,
-            "address": None,
-            "phone_number": None,
-            "license_number": None,
-            "affiliated_insurance_networks": [],
-            "services_offered": [],
-            "npi_data": {},
-            "practice_locations": [],
-            "credentials": [],
-            "scraped_sources": []
-        }        # Step 1: Search NPI Registry
-        logger.info("Step 1: Searching NPI Registry...")
-        npi_data = self._search_npi_registry(name, specialty)
+        doctor_info = _empty_doctor_info(name, specialty)
+        
+        # Steps 1, 3 and 5 do not depend on each other - run them concurrently,
+        # multiplexed over the shared HTTP/2 client
+        client = _get_http_client()
+        logger.info("Steps 1, 3, 5: Searching NPI Registry, Healthgrades and State Medical Board concurrently...")
+        npi_data, healthgrades_data, license_data = await asyncio.gather(
+            self._search_npi_registry(client, name, specialty),
+            self._search_healthgrades(client, name, specialty),
+            self._search_medical_board(client, name, specialty),
+        )
+        
+        # Deduplicated as they are collected: a set for insurance, an ordered dict for services
+        insurance_networks = set()
+        services_offered = {}
+        
+        # Step 1: NPI Registry
         if npi_data:
             doctor_info["npi_data"] = npi_data
             doctor_info["scraped_sources"].append("NPI Registry")
@@ -80,6 +719,7 @@ class DoctorInfoScraper:
         
         # Step 2: Conditionally search Google Places only if NPI didn't provide a good address
         npi_has_address = bool(npi_data and npi_data.get("best_address"))
+        webmd_data = None
         
         if npi_has_address:
             logger.info("Step 2: Skipping Google Places (NPI provided address)")
@@ -88,12 +728,27 @@ class DoctorInfoScraper:
             best_address = npi_data.get("best_address")
         else:
             logger.info("Step 2: Searching Google Places for address information...")
-            google_data = self._search_google_places(name, specialty)
+            if address:
+                # WebMD will search with the caller's address either way, so run it alongside Google Places
+                logger.info("Step 4: Searching WebMD for insurance verification (concurrently with Google Places)...")
+                google_data, webmd_data = await asyncio.gather(
+                    self._search_google_places(client, name, specialty, address),
+                    self._search_webmd(name, specialty, address),
+                    return_exceptions=True,
+                )
+                if isinstance(google_data, BaseException):
+                    logger.error(f"Google Places search error: {str(google_data)}")
+                    google_data = {}
+                if isinstance(webmd_data, BaseException):
+                    logger.error(f"WebMD search error: {str(webmd_data)}")
+                    webmd_data = {}
+            else:
+                google_data = await self._search_google_places(client, name, specialty, address)
             if google_data:
                 doctor_info.update(google_data)
                 doctor_info["scraped_sources"].append("Google Places")
             
-            # Step 3: Extract address for WebMD state detection
+            # Extract address for WebMD state detection
             # Prioritize provided address, then Google Places, then NPI
             best_address = address
             if not best_address and google_data.get("address"):
@@ -116,9 +771,7 @@ class DoctorInfoScraper:
                             break
         logger.info(f"Best address found for WebMD: {best_address}")
         
-        # Step 3: Search Healthgrades (optional)
-        logger.info("Step 3: Searching Healthgrades...")
-        healthgrades_data = self._search_healthgrades(name, specialty)
+        # Step 3: Healthgrades (optional)
         if healthgrades_data:
             # Only update if we don't have the data already
             if healthgrades_data.get("phone_number") and not doctor_info.get("phone_number"):
@@ -126,20 +779,20 @@ class DoctorInfoScraper:
             if healthgrades_data.get("address") and not doctor_info.get("address"):
                 doctor_info["address"] = healthgrades_data["address"]
             if healthgrades_data.get("services_offered"):
-                doctor_info["services_offered"].extend(healthgrades_data["services_offered"])
+                services_offered.update(dict.fromkeys(healthgrades_data["services_offered"]))
             doctor_info["scraped_sources"].append("Healthgrades")
-          # Step 4: Search WebMD for comprehensive insurance verification (LAST and MOST IMPORTANT)
-        logger.info("Step 4: Searching WebMD for insurance verification...")
-        webmd_data = self._search_webmd(name, specialty, best_address)
+        
+        # Step 4: Search WebMD for comprehensive insurance verification (LAST and MOST IMPORTANT)
+        if webmd_data is None:
+            logger.info("Step 4: Searching WebMD for insurance verification...")
+            webmd_data = await self._search_webmd(name, specialty, best_address)
         if webmd_data:
             # Merge WebMD data, prioritizing insurance information
             if webmd_data.get("affiliated_insurance_networks"):
-                doctor_info["affiliated_insurance_networks"].extend(webmd_data["affiliated_insurance_networks"])
-                # Remove duplicates
-                doctor_info["affiliated_insurance_networks"] = list(set(doctor_info["affiliated_insurance_networks"]))
+                insurance_networks.update(webmd_data["affiliated_insurance_networks"])
                 logger.info(f"📋 Added {len(webmd_data['affiliated_insurance_networks'])} insurance plans from WebMD")
             if webmd_data.get("services_offered"):
-                doctor_info["services_offered"].extend(webmd_data["services_offered"])
+                services_offered.update(dict.fromkeys(webmd_data["services_offered"]))
             if webmd_data.get("phone_number") and not doctor_info.get("phone_number"):
                 doctor_info["phone_number"] = webmd_data["phone_number"]
             if webmd_data.get("address") and not doctor_info.get("address"):
@@ -151,19 +804,50 @@ class DoctorInfoScraper:
             doctor_info["scraped_sources"].append("WebMD")
         else:
             logger.warning("⚠️ No WebMD data returned")
-            logger.info(f"Current insurance networks: {doctor_info['affiliated_insurance_networks']}")
+            logger.info(f"Current insurance networks: {sorted(insurance_networks)}")
             
-        # Step 5: Search State Medical Board (generic approach)
-        logger.info("Step 5: Searching State Medical Board information...")
-        license_data = self._search_medical_board(name, specialty)
+        # Step 5: State Medical Board (generic approach)
         if license_data:
             doctor_info.update(license_data)
             doctor_info["scraped_sources"].append("Medical Board")
+        
+        # Materialize the deduplicated accumulators once
+        doctor_info["affiliated_insurance_networks"] = sorted(insurance_networks)
+        doctor_info["services_offered"] = list(services_offered)
             
         logger.info(f"Search completed. Found data from {len(doctor_info['scraped_sources'])} sources")
         return doctor_info
     
-    def _search_npi_registry(self, name: str, specialty: str) -> Dict:
+    async def get_doctors_details_async_batch(self, queries: List[Tuple[str, str, Optional[str]]], max_concurrency: int = 8) -> List[Dict]:
+        """
+        Look up many doctors concurrently
+        
+        Args:
+            queries: (name, specialty, address) tuples; address may be None
+            max_concurrency (int): Maximum number of lookups in flight at once
+            
+        Returns:
+            List[Dict]: Doctor information in the same order as queries
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _one(name: str, specialty: str, address: Optional[str]) -> Dict:
+            async with semaphore:
+                try:
+                    return await self.get_doctor_details_async(name, specialty, address)
+                except Exception as e:
+                    logger.error(f"Batch lookup failed for {name}: {str(e)}")
+                    return _empty_doctor_info(name, specialty)
+        
+        logger.info(f"Starting batch search for {len(queries)} doctors (concurrency {max_concurrency})")
+        return await asyncio.gather(*(_one(name, specialty, address) for name, specialty, address in queries))
+    
+    @cached_async(_npi_cache_key, ttl=NPI_TTL)
+    async def _search_npi_registry(self, client: "httpx.AsyncClient", name: str, specialty: str) -> Dict:
+        """NPI Registry lookup through the response cache (see _fetch_npi_registry)"""
+        return await self._fetch_npi_registry(client, name, specialty)
+    
+    async def _fetch_npi_registry(self, client: "httpx.AsyncClient", name: str, specialty: str) -> Dict:
         """
         Search the NPI Registry using CMS API
         Prioritizes results with identifiers (insurance networks)
@@ -173,12 +857,7 @@ class DoctorInfoScraper:
             base_url = "https://npiregistry.cms.hhs.gov/api/"
             
             # Parse name (assuming format: "First Last" or "Last, First")
-            if "," in name:
-                last_name, first_name = [n.strip() for n in name.split(",", 1)]
-            else:
-                parts = name.strip().split()
-                first_name = parts[0] if parts else ""
-                last_name = " ".join(parts[1:]) if len(parts) > 1 else ""
+            first_name, last_name = _split_name(name)
             
             params = {
                 "version": "2.1",
@@ -189,10 +868,10 @@ class DoctorInfoScraper:
             }
             
             logger.info(f"Searching NPI for: {first_name} {last_name}")
-            response = self.session.get(base_url, params=params, timeout=10)
+            response = await _get_with_retries(client, base_url, params=params, limiter=_NPI_LIMITER)
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 results = data.get("results", [])
                 
                 if not results:
@@ -235,7 +914,7 @@ class DoctorInfoScraper:
                 
                 return data
                 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"NPI Registry search failed: {str(e)}")
         except Exception as e:
             logger.error(f"NPI Registry processing error: {str(e)}")
@@ -244,58 +923,30 @@ class DoctorInfoScraper:
     def _find_best_npi_match(self, results: List[Dict], first_name: str, last_name: str) -> Dict:
         """Find the best matching NPI result based on name similarity"""
         target_name = f"{first_name} {last_name}".lower().strip()
+        choices = {
+            i: f"{r.get('basic', {}).get('first_name', '')} {r.get('basic', {}).get('last_name', '')}".lower().strip()
+            for i, r in enumerate(results)
+        }
         
-        best_match = results[0]  # Default to first result
-        best_score = 0
-        
-        for result in results:
-            basic = result.get("basic", {})
-            result_first = basic.get("first_name", "").lower().strip()
-            result_last = basic.get("last_name", "").lower().strip()
-            result_name = f"{result_first} {result_last}"
-            
-            # Calculate simple similarity score
-            score = 0
-            if first_name.lower() in result_first:
-                score += 2
-            if last_name.lower() in result_last:
-                score += 2
-            if result_first in first_name.lower():
-                score += 1
-            if result_last in last_name.lower():
-                score += 1
-            
-            # Check for exact matches
-            if result_first == first_name.lower():
-                score += 3
-            if result_last == last_name.lower():
-                score += 3
-            
-            if score > best_score:
-                best_score = score
-                best_match = result
+        match = process.extractOne(target_name, choices, scorer=fuzz.WRatio)
+        if not match:
+            return results[0]  # Default to first result
         
-        return best_match
+        _, score, best_idx = match
+        logger.debug(f"Best NPI name match score: {score:.1f}")
+        return results[best_idx]
     
     def _extract_best_address_from_npi(self, npi_result: Dict) -> Optional[str]:
         """Extract the best address from NPI result (prioritize LOCATION over MAILING)"""
         addresses = npi_result.get("addresses", [])
         
-        if not addresses:
-            return None
-        
-        # Look for LOCATION address first
-        for addr in addresses:
-            if addr.get("address_purpose") == "LOCATION":
-                return self._format_npi_address(addr)
-        
-        # Fall back to MAILING address
-        for addr in addresses:
-            if addr.get("address_purpose") == "MAILING":
-                return self._format_npi_address(addr)
-        
-        # If no specific type found, use first address
-        return self._format_npi_address(addresses[0])
+        # Single pass: LOCATION beats MAILING, and max() keeps the first address on ties
+        best = max(
+            addresses,
+            key=lambda addr: _NPI_ADDRESS_PRIORITY.get(addr.get("address_purpose"), 0),
+            default=None,
+        )
+        return self._format_npi_address(best) if best else None
     
     def _format_npi_address(self, addr: Dict) -> str:
         """Format NPI address into a single string"""
@@ -318,67 +969,24 @@ class DoctorInfoScraper:
         
         return ", ".join(parts)
     
-    def _search_provider_directories(self, name: str, specialty: str, address: str = None) -> Dict:
-        """
-        Search common healthcare provider directories
-        """
-        provider_info = {
-            "address": None,
-            "phone_number": None,
-            "services_offered": [],
-            "affiliated_insurance_networks": []
-        }
-        
-        try:
-            # Search Healthgrades (optional - can be removed)
-            healthgrades_data = self._search_healthgrades(name, specialty)
-            if healthgrades_data:
-                provider_info.update(healthgrades_data)
-                
-            # Search WebMD (essential for insurance verification)
-            webmd_data = self._search_webmd(name, specialty, address)
-            if webmd_data:
-                # Merge data
-                if webmd_data.get("services_offered"):
-                    provider_info["services_offered"].extend(webmd_data["services_offered"])
-                if webmd_data.get("phone_number") and not provider_info["phone_number"]:
-                    provider_info["phone_number"] = webmd_data["phone_number"]
-                if webmd_data.get("affiliated_insurance_networks"):
-                    provider_info["affiliated_insurance_networks"].extend(webmd_data["affiliated_insurance_networks"])
-                if webmd_data.get("address") and not provider_info["address"]:
-                    provider_info["address"] = webmd_data["address"]
-                    
-        except Exception as e:
-            logger.error(f"Provider directory search error: {str(e)}")
-            
-        return provider_info
-    
-    def _search_healthgrades(self, name: str, specialty: str) -> Dict:
+    @cached_async(_healthgrades_cache_key, ttl=HEALTHGRADES_TTL)
+    async def _search_healthgrades(self, client: "httpx.AsyncClient", name: str, specialty: str) -> Dict:
         """
         Search Healthgrades for doctor information
+        
+        Results are cached in Redis (when configured) for HEALTHGRADES_TTL seconds.
         """
         try:
             search_url = f"https://www.healthgrades.com/usearch?what={quote(name + ' ' + specialty)}&where="
             logger.info(f"Searching Healthgrades: {search_url}")
             
-            response = self.session.get(search_url, timeout=10)
+            response = await _get_with_retries(client, search_url, limiter=_HEALTHGRADES_LIMITER)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for provider cards or listings
-                provider_cards = soup.find_all(['div', 'article'], class_=re.compile(r'provider|doctor|listing'))
+                card = _parse_healthgrades_card(response.text)
                 
-                if provider_cards:
+                if card is not None:
                     # Extract information from first matching result
-                    card = provider_cards[0]
-                    
-                    # Try to extract phone number
-                    phone_elements = card.find_all(text=re.compile(r'\(\d{3}\)\s*\d{3}-\d{4}'))
-                    phone = phone_elements[0] if phone_elements else None
-                    
-                    # Try to extract address
-                    address_elements = card.find_all(['span', 'div'], class_=re.compile(r'address|location'))
-                    address = address_elements[0].get_text(strip=True) if address_elements else None
+                    phone, address = card
                     
                     return {
                         "phone_number": phone,
@@ -391,7 +999,7 @@ class DoctorInfoScraper:
             
         return {}
     
-    def _search_webmd(self, name: str, specialty: str, address: str = None) -> Dict:
+    async def _search_webmd(self, name: str, specialty: str, address: str = None) -> Dict:
         """
         Search WebMD physician directory using Playwright with enhanced scraping
         """
@@ -401,26 +1009,21 @@ class DoctorInfoScraper:
                 logger.warning("Playwright is not available or compatible on this system. Skipping WebMD scraping.")
                 return {}
             
-            # Extract state from address if provided
+            # Extract state from address if provided, geocoding it when parsing fails
             state = self._extract_state_from_address(address) if address else None
+            if address and not state:
+                state = await self._geocode_to_state(address)
             
             # Map specialty to WebMD format
-            webmd_specialty = self._map_specialty_to_webmd(specialty)            # Use Playwright for WebMD scraping - run in new event loop if needed
+            webmd_specialty = self._map_specialty_to_webmd(specialty)
+            
+            # Already on the shared scraper loop, so the pooled Playwright browser is reused
             try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # We're in an async context, need to run in thread
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(self._run_webmd_scraping_sync, name, webmd_specialty, state)
-                        return future.result(timeout=180)  # Increased timeout to 180 seconds (3 minutes)
-                else:
-                    # No event loop running, safe to use async
-                    return asyncio.run(self._scrape_webmd_with_playwright(name, webmd_specialty, state))
-            except RuntimeError:
-                # No event loop, create one
-                return asyncio.run(self._scrape_webmd_with_playwright(name, webmd_specialty, state))
-            except concurrent.futures.TimeoutError:
+                return await asyncio.wait_for(
+                    self._scrape_webmd_with_playwright(name, webmd_specialty, state),
+                    timeout=180,  # Increased timeout to 180 seconds (3 minutes)
+                )
+            except asyncio.TimeoutError:
                 logger.error(f"⏱️ WebMD scraping timeout after 180 seconds")
                 logger.warning("⚠️ WebMD scraping took too long - this may indicate network issues or slow page loading")
                 return {}
@@ -432,100 +1035,93 @@ class DoctorInfoScraper:
         return {}
     
     def _is_playwright_available(self) -> bool:
-        """Check if Playwright is available and working on this system"""
-        try:
-            # Quick test to see if Playwright can initialize
-            import subprocess
-            import sys
-            
-            # On Windows, check if we can run playwright
-            if platform.system() == "Windows":
-                try:
-                    result = subprocess.run(
-                        [sys.executable, "-c", "from playwright.async_api import async_playwright; print('OK')"],
-                        capture_output=True,
-                        timeout=10,
-                        text=True
-                    )
-                    return result.returncode == 0 and "OK" in result.stdout
-                except Exception:
-                    return False
-            else:                # On non-Windows systems, assume it works if imported successfully
-                return True
-                
-        except Exception as e:
-            logger.debug(f"Playwright availability check failed: {str(e)}")
-            return False
+        """Check if Playwright is available on this system (resolved once at import)"""
+        return _PLAYWRIGHT_USABLE
     
-    def _run_webmd_scraping_sync(self, name: str, specialty: str, state: str = None) -> Dict:
-        """Run WebMD scraping in a new event loop (for thread execution)"""
-        try:            # On Windows, set the appropriate event loop policy
-            if platform.system() == "Windows":
-                # Try to use ProactorEventLoop which supports subprocesses on Windows
-                try:
-                    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-                except Exception as e:
-                    logger.warning(f"Could not set Windows event loop policy: {e}")
-                    return {}
-            
-            return asyncio.run(self._scrape_webmd_with_playwright(name, specialty, state))
-        except NotImplementedError as e:
-            logger.warning(f"Asyncio subprocess not supported on this system: {e}")
-            return {}
-        except Exception as e:
-            logger.error(f"Error in WebMD sync scraping: {e}")
+    async def _geocode_to_state(self, address: str) -> Optional[str]:
+        """
+        Resolve an address to a WebMD state slug via OpenStreetMap Nominatim
+        
+        Used only when the state can't be parsed from the address text.
+        """
+        return (await self._geocode(address)).get("state")
+    
+    async def _geocode(self, address: str) -> Dict:
+        """
+        Geocode an address with OpenStreetMap Nominatim
+        
+        Returns {"state": WebMD state slug, "lat": float, "lng": float}, with None
+        values for a miss, or {} if the lookup failed. Results (including misses)
+        are cached for GEOCODE_TTL seconds.
+        """
+        cache_key = address.lower().strip()
+        location = _GEOCODE_CACHE.get(cache_key)
+        if location is not None:
+            return location
+        
+        # Places and WebMD often geocode the same address at once; share one request
+        return await _coalesced(("geo", cache_key), lambda: self._fetch_geocode(address, cache_key))
+    
+    async def _fetch_geocode(self, address: str, cache_key: str) -> Dict:
+        redis_key = make_key("geo", cache_key)
+        cached = await get_json_async(redis_key)
+        # Entries written before coordinates were stored only hold the state
+        if cached is not None and "lat" in cached:
+            _GEOCODE_CACHE[cache_key] = cached
+            return cached
+        
+        location = {"state": None, "lat": None, "lng": None}
+        try:
+            response = await _get_with_retries(
+                _get_http_client(),
+                "https://nominatim.openstreetmap.org/search",
+                limiter=_NOMINATIM_LIMITER,
+                params={"q": address, "format": "jsonv2", "addressdetails": 1, "limit": 1, "countrycodes": "us"},
+                headers={"User-Agent": NOMINATIM_USER_AGENT},
+                timeout=5,
+            )
+            if response.status_code == 200:
+                results = orjson.loads(response.content)
+                if results:
+                    state_name = results[0].get("address", {}).get("state", "")
+                    location["state"] = _STATE_NAMES.get(state_name.lower())
+                    location["lat"] = float(results[0]["lat"])
+                    location["lng"] = float(results[0]["lon"])
+                    if location["state"]:
+                        logger.info(f"✅ Geocoded address to state: '{state_name}' -> '{location['state']}'")
+            else:
+                logger.warning(f"Nominatim geocoding failed: {response.status_code}")
+                return {}
+        except (httpx.HTTPError, KeyError, ValueError) as e:
+            logger.warning(f"Nominatim geocoding error: {str(e)}")
             return {}
+        
+        _GEOCODE_CACHE[cache_key] = location
+        await set_json_async(redis_key, location, GEOCODE_TTL)
+        return location
     
     def _extract_state_from_address(self, address: str) -> Optional[str]:
         """Extract state from address and convert to full name for WebMD URL"""
         if not address:
             return None
         
-        # Map state abbreviations to full state names (URL format with hyphens)
-        state_abbrev_to_name = {
-            'AL': 'alabama', 'AK': 'alaska', 'AZ': 'arizona', 'AR': 'arkansas', 'CA': 'california',
-            'CO': 'colorado', 'CT': 'connecticut', 'DE': 'delaware', 'FL': 'florida', 'GA': 'georgia',
-            'HI': 'hawaii', 'ID': 'idaho', 'IL': 'illinois', 'IN': 'indiana', 'IA': 'iowa',
-            'KS': 'kansas', 'KY': 'kentucky', 'LA': 'louisiana', 'ME': 'maine', 'MD': 'maryland',
-            'MA': 'massachusetts', 'MI': 'michigan', 'MN': 'minnesota', 'MS': 'mississippi', 'MO': 'missouri',
-            'MT': 'montana', 'NE': 'nebraska', 'NV': 'nevada', 'NH': 'new-hampshire', 'NJ': 'new-jersey',
-            'NM': 'new-mexico', 'NY': 'new-york', 'NC': 'north-carolina', 'ND': 'north-dakota', 'OH': 'ohio',
-            'OK': 'oklahoma', 'OR': 'oregon', 'PA': 'pennsylvania', 'RI': 'rhode-island', 'SC': 'south-carolina',
-            'SD': 'south-dakota', 'TN': 'tennessee', 'TX': 'texas', 'UT': 'utah', 'VT': 'vermont',
-            'VA': 'virginia', 'WA': 'washington', 'WV': 'west-virginia', 'WI': 'wisconsin', 'WY': 'wyoming'
-        }
-        
-        # Map full state names to URL format
-        state_names = {
-            'alabama': 'alabama', 'alaska': 'alaska', 'arizona': 'arizona', 'arkansas': 'arkansas', 'california': 'california',
-            'colorado': 'colorado', 'connecticut': 'connecticut', 'delaware': 'delaware', 'florida': 'florida', 'georgia': 'georgia',
-            'hawaii': 'hawaii', 'idaho': 'idaho', 'illinois': 'illinois', 'indiana': 'indiana', 'iowa': 'iowa',
-            'kansas': 'kansas', 'kentucky': 'kentucky', 'louisiana': 'louisiana', 'maine': 'maine', 'maryland': 'maryland',
-            'massachusetts': 'massachusetts', 'michigan': 'michigan', 'minnesota': 'minnesota', 'mississippi': 'mississippi', 'missouri': 'missouri',
-            'montana': 'montana', 'nebraska': 'nebraska', 'nevada': 'nevada', 'new hampshire': 'new-hampshire', 'new jersey': 'new-jersey',
-            'new mexico': 'new-mexico', 'new york': 'new-york', 'north carolina': 'north-carolina', 'north dakota': 'north-dakota', 'ohio': 'ohio',
-            'oklahoma': 'oklahoma', 'oregon': 'oregon', 'pennsylvania': 'pennsylvania', 'rhode island': 'rhode-island', 'south carolina': 'south-carolina',
-            'south dakota': 'south-dakota', 'tennessee': 'tennessee', 'texas': 'texas', 'utah': 'utah', 'vermont': 'vermont',
-            'virginia': 'virginia', 'washington': 'washington', 'west virginia': 'west-virginia', 'wisconsin': 'wisconsin', 'wyoming': 'wyoming'
-        }
-        
         # Try to find state abbreviation (2 uppercase letters)
-        state_pattern = r'\b[A-Z]{2}\b'
-        state_matches = re.findall(state_pattern, address.upper())
+        state_matches = _STATE_ABBREV_RE.findall(address.upper())
         
         if state_matches:
             state_abbrev = state_matches[-1]  # Get the last match (likely the state)
-            full_state = state_abbrev_to_name.get(state_abbrev)
+            full_state = _STATE_ABBREV_TO_NAME.get(state_abbrev)
             if full_state:
                 logger.info(f"✅ Converted state abbreviation '{state_abbrev}' -> '{full_state}'")
                 return full_state
         
-        # Try to match full state names in the address
-        address_lower = address.lower()
-        for state_name, state_url_format in state_names.items():
-            if state_name in address_lower:
-                logger.info(f"✅ Found full state name in address: '{state_name}' -> '{state_url_format}'")
-                return state_url_format
+        # Try to match full state names in the address; prefer the longest name
+        # so "west virginia" wins over "virginia"
+        state_name_matches = _find_state_names(address.lower())
+        if state_name_matches:
+            state_name, state_url_format = max(state_name_matches, key=lambda m: len(m[0]))
+            logger.info(f"✅ Found full state name in address: '{state_name}' -> '{state_url_format}'")
+            return state_url_format
                 
         logger.warning(f"⚠️ Could not extract state from address: {address}")
         return None
@@ -561,15 +1157,13 @@ class DoctorInfoScraper:
         specialty_lower = specialty.lower().strip()
         return specialty_mapping.get(specialty_lower, specialty_lower.replace(' ', '-').replace('&', 'and'))
     
-    def _normalize_name(self, name: str) -> str:
-        """Normalize doctor name for comparison"""
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _normalize_name(name: str) -> str:
+        """Normalize doctor name for comparison (pure, so results are memoized)"""
         if not name:
             return ""
-        name = name.lower()
-        name = re.sub(r"dr\.?", "", name)
-        name = re.sub(r"[.,]", "", name)
-        name = re.sub(r"\b(md|do|phd|dds)\b", "", name)
-        name = re.sub(r"\s+", " ", name)
+        name = _WS_RE.sub(" ", _NORM_RE.sub(" ", name.lower()))
         
         # Handle common name variations
         # Sarah/Sara, Cathy/Kathy, etc.
@@ -580,21 +1174,41 @@ class DoctorInfoScraper:
     def _find_doctor_in_results(self, doctors: List[Dict], target_name: str) -> Optional[Dict]:
         """Find matching doctor from scraped results with fuzzy matching"""
         target_norm = self._normalize_name(target_name)
-        target_parts = target_norm.split()
         
         logger.debug(f"Looking for normalized target: '{target_norm}'")
-        logger.debug(f"Target parts: {target_parts}")
         
-        for doctor in doctors:
-            doctor_norm = self._normalize_name(doctor["name"])
-            logger.debug(f"Checking: '{doctor_norm}'")
-            
-            # Token-based match - all target parts should be in doctor name
-            if all(part in doctor_norm for part in target_parts):
-                logger.debug("✅ MATCH FOUND")
-                logger.info(f"✅ Found matching doctor: {doctor['name']} -> normalized: '{doctor_norm}'")
+        # Normalize each candidate once and index them by token
+        choices = {i: self._normalize_name(d["name"]) for i, d in enumerate(doctors)}
+        index = defaultdict(set)
+        for i, doctor_norm in choices.items():
+            for token in doctor_norm.split():
+                index[token].add(i)
+        
+        # Every target token present in a candidate is an exact match; skip fuzzy scoring
+        target_parts = target_norm.split()
+        if target_parts:
+            candidates = set.intersection(*(index.get(part, set()) for part in target_parts))
+            if candidates:
+                idx = min(candidates)
+                doctor = doctors[idx]
+                logger.info(f"✅ Found matching doctor: {doctor['name']} -> normalized: '{choices[idx]}'")
                 return doctor
         
+        # Fuzzy hits still need every target token somewhere in the candidate ("john" in "johnathan"),
+        # so a bare surname or a name missing the target's middle name is never accepted
+        plausible = {
+            i: doctor_norm for i, doctor_norm in choices.items()
+            if target_parts and all(part in doctor_norm for part in target_parts)
+        }
+        match = process.extractOne(target_norm, plausible, scorer=fuzz.WRatio, score_cutoff=85)
+        
+        if match:
+            doctor_norm, score, idx = match
+            doctor = doctors[idx]
+            logger.debug(f"✅ MATCH FOUND (score {score:.1f})")
+            logger.info(f"✅ Found matching doctor: {doctor['name']} -> normalized: '{doctor_norm}'")
+            return doctor
+        
         logger.debug("❌ No match found")
         return None
     async def _scrape_webmd_with_playwright(self, name: str, specialty: str, state: str = None) -> Dict:
@@ -608,64 +1222,45 @@ class DoctorInfoScraper:
         }
         
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=["--disable-blink-features=AutomationControlled"],
-                )
-                
-                context = await browser.new_context(
-                    user_agent=(
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/121.0.0.0 Safari/537.36"
-                    ),
-                    locale="en-US",
-                    viewport={"width": 1920, "height": 1080},
-                )
-                
-                page = await context.new_page()
-                
-                # Search for doctors across multiple states if no state provided
-                states_to_search = [state] if state else ['idaho', 'california', 'texas', 'florida', 'new-york']
-                
-                doctor_found = None
+            # Search for doctors across multiple states if no state provided
+            states_to_search = [state] if state else WEBMD_FALLBACK_STATES
+            
+            # Each state is scraped in its own pooled context; the first match wins and the rest are cancelled
+            semaphore = asyncio.Semaphore(3)
+            tasks = [
+                asyncio.create_task(self._scrape_state(semaphore, name, specialty, search_state))
+                for search_state in states_to_search
+                if search_state
+            ]
+            
+            doctor_found = None
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    doctor_found = await next_done
+                    if doctor_found:
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
+                # Drain the cancelled searches so their pooled contexts are released before moving on
+                await asyncio.gather(*tasks, return_exceptions=True)
+            
+            if doctor_found:
+                # Get detailed information from doctor profile (memoized per URL)
+                details = await _fetch_doctor_overview(doctor_found["url"])
                 
-                for search_state in states_to_search:
-                    if not search_state:
-                        continue
-                        
-                    logger.info(f"Searching WebMD in {search_state} for {name} - {specialty}")
-                    
-                    # Scrape doctors from WebMD
-                    doctors = await self._scrape_doctors_from_webmd(page, specialty, search_state)
-                    
-                    if doctors:
-                        # Find matching doctor
-                        doctor_found = self._find_doctor_in_results(doctors, name)
-                        if doctor_found:
-                            logger.info(f"✅ Found matching doctor: {doctor_found['name']} in {search_state}")
-                            break
-                    
-                    logger.info(f"No match found in {search_state}, trying next state...")
+                # Map details to our format
+                webmd_data.update({
+                    "services_offered": [specialty] if specialty else [],
+                    "affiliated_insurance_networks": details.get("insurance_accepted", []),
+                    "phone_number": details.get("phones", [None])[0] if details.get("phones") else None,
+                    "address": details.get("addresses", [None])[0] if details.get("addresses") else None,
+                    "rating": details.get("rating"),
+                    "languages": details.get("languages", []),
+                    "webmd_profile_url": doctor_found["url"]
+                })
                 
-                if doctor_found:
-                    # Get detailed information from doctor profile
-                    details = await self._scrape_doctor_overview(page, doctor_found["url"])
-                    
-                    # Map details to our format
-                    webmd_data.update({
-                        "services_offered": [specialty] if specialty else [],
-                        "affiliated_insurance_networks": details.get("insurance_accepted", []),
-                        "phone_number": details.get("phones", [None])[0] if details.get("phones") else None,
-                        "address": details.get("addresses", [None])[0] if details.get("addresses") else None,                        "rating": details.get("rating"),
-                        "languages": details.get("languages", []),
-                        "webmd_profile_url": doctor_found["url"]
-                    })
-                    
-                    logger.info(f"WebMD data extracted: {len(details.get('insurance_accepted', []))} insurance plans found")
-                    
-                await browser.close()
+                logger.info(f"WebMD data extracted: {len(details.get('insurance_accepted', []))} insurance plans found")
                 
         except Exception as e:
             logger.error(f"Playwright WebMD scraping error: {str(e)}")
@@ -673,41 +1268,81 @@ class DoctorInfoScraper:
         
         return webmd_data
     
-    async def _scrape_doctors_from_webmd(self, page, specialty: str, state: str, max_pages: int = 8) -> List[Dict]:
-        """Scrape doctor names from WebMD search results - parallel 8 pages version"""
+    async def _scrape_state(self, semaphore: asyncio.Semaphore, name: str, specialty: str, state: str) -> Optional[Dict]:
+        """Search one state's WebMD listings and return the matching doctor, if any"""
+        async with semaphore:
+            try:
+                logger.info(f"Searching WebMD in {state} for {name} - {specialty}")
+                
+                # Scrape doctors from WebMD (a pooled context is only borrowed on a cache miss)
+                doctors = await self._scrape_doctors_from_webmd(specialty, state)
+                
+                if doctors:
+                    # Find matching doctor
+                    doctor_found = self._find_doctor_in_results(doctors, name)
+                    if doctor_found:
+                        logger.info(f"✅ Found matching doctor: {doctor_found['name']} in {state}")
+                        return doctor_found
+                
+                logger.info(f"No match found in {state}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"WebMD search in {state} failed: {str(e)}")
+        return None
+    
+    async def _scrape_doctors_from_webmd(self, specialty: str, state: str, max_pages: int = 8) -> List[Dict]:
+        """Scrape doctor names from WebMD search results - parallel 8 pages version (cached per state)"""
         base_url = f"https://doctor.webmd.com/providers/specialty/{specialty}/{state}"
         
+        # Checked before anything is borrowed from the browser pool
+        cache_key = make_key("webmd-state", specialty, state, str(max_pages))
+        cached = await get_json_async(cache_key)
+        if cached is not None:
+            logger.info(f"✅ Using cached WebMD listings for {specialty} in {state} ({len(cached)} doctors)")
+            return cached
+        
         logger.info(f"🔍 Starting WebMD doctor name extraction (8 pages in parallel)")
         logger.info(f"📍 Target: specialty='{specialty}', state='{state}'")
         logger.info(f"🌐 Base URL: {base_url}")
         
         try:
-            # Get the browser context from the page
-            context = page.context
-            
-            # Create tasks for scraping 8 pages in parallel
-            scraping_tasks = []
-            for page_num in range(1, max_pages + 1):
-                url = base_url if page_num == 1 else f"{base_url}?pagenumber={page_num}"
-                scraping_tasks.append(self._scrape_single_page(context, url, page_num))
-            
-            # Execute all page scraping tasks in parallel
-            logger.info(f"🚀 Launching {max_pages} parallel page scraping tasks...")
-            page_results = await asyncio.gather(*scraping_tasks, return_exceptions=True)
-            
-            # Collect all doctors from all pages
-            all_doctors = []
+            # One JSON request per page is far cheaper than rendering it, when the API is configured
+            if WEBMD_API_URL:
+                api_doctors = await self._try_webmd_api(specialty, state, max_pages)
+                if api_doctors:
+                    logger.info(f"✅ WebMD API returned {len(api_doctors)} unique doctors")
+                    await set_json_async(cache_key, api_doctors, WEBMD_SEARCH_TTL)
+                    return api_doctors
+                logger.info("WebMD API unavailable, falling back to Playwright")
+            
+            unique = {}
             successful_pages = 0
-            for page_num, result in enumerate(page_results, 1):
-                if isinstance(result, Exception):
-                    logger.error(f"❌ Page {page_num} failed: {str(result)}")
-                elif result:
-                    all_doctors.extend(result)
-                    successful_pages += 1
-                    logger.info(f"✅ Page {page_num}: Found {len(result)} doctors")
-            
-            # Deduplicate by URL
-            unique_doctors = list({d["url"]: d for d in all_doctors}.values())
+            async with _BROWSER_POOL.context() as context:
+                # Create tasks for scraping 8 pages in parallel
+                # (_scrape_single_page returns [] on failure, so no task can raise)
+                scraping_tasks = []
+                for page_num in range(1, max_pages + 1):
+                    url = base_url if page_num == 1 else f"{base_url}?pagenumber={page_num}"
+                    scraping_tasks.append(asyncio.create_task(self._scrape_single_page(context, url, page_num)))
+                
+                # Merge pages as they finish, deduplicating by URL
+                logger.info(f"🚀 Launching {max_pages} parallel page scraping tasks...")
+                try:
+                    for next_done in asyncio.as_completed(scraping_tasks):
+                        result = await next_done
+                        if result:
+                            for doctor in result:
+                                unique.setdefault(doctor["url"], doctor)
+                            successful_pages += 1
+                finally:
+                    # Only has an effect if this search itself is cancelled
+                    for task in scraping_tasks:
+                        task.cancel()
+            
+            unique_doctors = list(unique.values())
+            if unique_doctors:
+                await set_json_async(cache_key, unique_doctors, WEBMD_SEARCH_TTL)
             logger.info(f"")
             logger.info(f"{'='*60}")
             logger.info(f"🎯 PARALLEL SCRAPING COMPLETE")
@@ -721,78 +1356,164 @@ class DoctorInfoScraper:
             logger.error(f"Traceback: {traceback.format_exc()}")
             return []
     
-    async def _scrape_single_page(self, context, url: str, page_num: int) -> List[Dict]:
-        """Scrape a single WebMD search page in a new tab with lazy loading"""
-        doctors = []
-        new_page = None
+    async def _try_webmd_api(self, specialty: str, state: str, max_pages: int = 8) -> Optional[List[Dict]]:
+        """
+        Fetch WebMD search results from the JSON API configured in WEBMD_API_URL
+        
+        Returns None on any HTTP error or unexpected payload so the caller can
+        fall back to scraping the rendered pages.
+        """
+        client = _get_http_client()
+        
+        async def fetch(page_num: int) -> List[Dict]:
+            url = WEBMD_API_URL.format(specialty=quote(specialty), state=quote(state), page=page_num)
+            response = await _get_with_retries(
+                client, url, limiter=_WEBMD_API_LIMITER, headers={"Accept": "application/json"}
+            )
+            response.raise_for_status()
+            return _providers_from_payload(orjson.loads(response.content))
         
         try:
-            # Create a new page (tab) for this scraping task
-            new_page = await context.new_page()
+            pages = await asyncio.gather(*(fetch(page_num) for page_num in range(1, max_pages + 1)))
+        except (httpx.HTTPError, orjson.JSONDecodeError, ValueError, AttributeError) as e:
+            logger.warning(f"WebMD API request failed: {str(e)[:100]}")
+            return None
+        
+        unique = {}
+        for page_doctors in pages:
+            for doctor in page_doctors:
+                unique.setdefault(doctor["url"], doctor)
+        return list(unique.values())
+    
+    async def _scrape_single_page(self, context, url: str, page_num: int) -> List[Dict]:
+        """Scrape a single WebMD search page in a new tab with lazy loading (cached by URL)"""
+        cache_key = make_key("webmd-search", url)
+        cached = await get_json_async(cache_key)
+        if cached is not None:
+            logger.debug(f"📄 Page {page_num}: Using cached listings for {url}")
+            return cached
+        
+        # Bounded so concurrent scrapes don't open more tabs than the browser can handle
+        async with _PAGE_SEMAPHORE:
+            new_page = None
+            api_response = rendered = None
             
-            logger.debug(f"📄 Page {page_num}: Navigating to {url}")
-            await new_page.goto(url, wait_until="domcontentloaded")
-            await new_page.wait_for_timeout(3000)
-            
-            # ✅ TRIGGER LAZY LOADING (same as POC code)
-            logger.debug(f"📄 Page {page_num}: Triggering lazy loading...")
-            for scroll_round in range(4):
-                await new_page.mouse.wheel(0, 2500)
-                await new_page.wait_for_timeout(700)
-            
-            logger.debug(f"📄 Page {page_num}: Lazy loading complete, parsing content...")
-            
-            # Get page content AFTER lazy loading
-            content = await new_page.content()
-            soup = BeautifulSoup(content, "html.parser")
-            
-            # ✅ USE CORRECT SELECTOR from POC code
-            providers = soup.select("a.prov-name")
-            
-            logger.debug(f"📄 Page {page_num}: Found {len(providers)} provider links")
-            
-            if not providers:
-                logger.warning(f"📄 Page {page_num}: No providers found")
-                return []
-            
-            # Extract doctor names and URLs
-            for a in providers:
+            try:
+                # Create a new page (tab) for this scraping task
+                new_page = await context.new_page()
+                
+                logger.debug(f"📄 Page {page_num}: Navigating to {url}")
+                # Listen before navigating so the listings XHR can't be missed (only when its endpoint is known)
+                if _WEBMD_LISTINGS_PREFIX:
+                    api_response = asyncio.ensure_future(
+                        new_page.wait_for_event("response", predicate=_is_provider_json_response, timeout=10000)
+                    )
+                    # Consume a late timeout even if navigation fails before the race below
+                    api_response.add_done_callback(_consume_outcome)
+                # Return once the response arrives; the listings are awaited explicitly below
+                await new_page.goto(url, wait_until="commit", timeout=15000)
+                
+                # Wait for the first listings instead of sleeping a fixed amount
+                rendered = asyncio.ensure_future(new_page.wait_for_selector("a.prov-name", timeout=10000))
+                rendered.add_done_callback(_consume_outcome)
+                
+                # Read the providers straight from the JSON when it beats the rendered listings
+                if api_response is not None:
+                    doctors = await self._read_provider_response(new_page, api_response, rendered, page_num)
+                    if doctors:
+                        await set_json_async(cache_key, doctors, WEBMD_SEARCH_TTL)
+                        return doctors
+                
+                # The same wait the race used, so an empty page costs 10s once
                 try:
-                    name = a.get_text(strip=True)
-                    href = a.get("href")
-                    
-                    if not name or not href:
-                        continue
-                    
-                    # Ensure href is a full URL
-                    if href.startswith('/'):
-                        href = f"https://doctor.webmd.com{href}"
-                    elif not href.startswith('http'):
-                        href = f"https://doctor.webmd.com/{href}"
-                    
-                    doctor_entry = {
-                        "name": name,
-                        "url": href.split("?")[0]  # Remove query parameters
-                    }
-                    
-                    doctors.append(doctor_entry)
-                    
-                except Exception as e:
-                    logger.debug(f"📄 Page {page_num}: Error processing provider: {str(e)}")
-                    continue
-            
-            return doctors
+                    await rendered
+                except PlaywrightTimeoutError:
+                    logger.warning(f"📄 Page {page_num}: No provider links after 10s")
+                    return []
+                
+                # ✅ TRIGGER LAZY LOADING: jump to the bottom once and wait for more providers to attach
+                logger.debug(f"📄 Page {page_num}: Triggering lazy loading...")
+                initial_count = await new_page.locator("a.prov-name").count()
+                await new_page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                try:
+                    await new_page.wait_for_function(
+                        "n => document.querySelectorAll('a.prov-name').length > n",
+                        arg=initial_count,
+                        timeout=2000,
+                    )
+                except PlaywrightTimeoutError:
+                    # Everything was already rendered with the first batch
+                    pass
+                
+                logger.debug(f"📄 Page {page_num}: Lazy loading complete, parsing content...")
+                
+                # Get page content AFTER lazy loading
+                content = await new_page.content()
+                
+                # Parse in a worker thread so other tabs keep progressing on the loop
+                doctors = await asyncio.to_thread(_parse_search_results, content)
+                
+                logger.debug(f"📄 Page {page_num}: Found {len(doctors)} provider links")
+                
+                if not doctors:
+                    logger.warning(f"📄 Page {page_num}: No providers found")
+                else:
+                    await set_json_async(cache_key, doctors, WEBMD_SEARCH_TTL)
+                
+                return doctors
             
+            except Exception as e:
+                logger.error(f"❌ Page {page_num} error: {str(e)}")
+                return []
+            finally:
+                # Stop whichever listings wait is still pending, then close the page to free resources
+                for waiter in (api_response, rendered):
+                    if waiter is not None and not waiter.done():
+                        waiter.cancel()
+                if new_page:
+                    try:
+                        await new_page.close()
+                    except:
+                        pass
+    
+    async def _read_provider_response(self, page, api_response: asyncio.Future, rendered: asyncio.Future,
+                                      page_num: int) -> Optional[List[Dict]]:
+        """
+        Race the listings XHR against the rendered provider links
+        
+        Returns the providers parsed from the JSON response if it arrives first,
+        or None so the caller falls back to the DOM. Like the DOM path, the page is
+        scrolled once and a follow-up listings response (lazy loading) is merged in.
+        The caller owns rendered and keeps awaiting it on a fallback.
+        """
+        try:
+            await asyncio.wait({api_response, rendered}, return_when=asyncio.FIRST_COMPLETED)
+            if not api_response.done() or api_response.exception() is not None:
+                return None
+            doctors = {
+                doctor["url"]: doctor
+                for doctor in _providers_from_payload(orjson.loads(await api_response.result().body()))
+            }
         except Exception as e:
-            logger.error(f"❌ Page {page_num} error: {str(e)}")
-            return []
+            logger.debug(f"📄 Page {page_num}: Listings XHR unusable, parsing the page: {str(e)[:100]}")
+            return None
         finally:
-            # Close the page to free resources
-            if new_page:
-                try:
-                    await new_page.close()
-                except:
-                    pass
+            if not api_response.done():
+                api_response.cancel()
+        
+        # Same lazy-loading step as the DOM path: jump to the bottom and wait briefly for the next batch
+        try:
+            async with page.expect_response(_is_provider_json_response, timeout=2000) as more_info:
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            more = await more_info.value
+            for doctor in _providers_from_payload(orjson.loads(await more.body())):
+                doctors.setdefault(doctor["url"], doctor)
+        except (PlaywrightTimeoutError, ValueError):
+            # Everything was already in the first batch (or the follow-up was unusable)
+            pass
+        
+        logger.debug(f"📄 Page {page_num}: {len(doctors)} providers from the listings XHR")
+        return list(doctors.values())
     
     async def _scrape_doctor_overview(self, page, url: str) -> Dict:
         """Scrape detailed doctor information from profile page with enhanced logging"""
@@ -803,102 +1524,19 @@ class DoctorInfoScraper:
         try:
             # Load the page
             logger.debug(f"⏳ Navigating to profile page...")
-            await page.goto(url, wait_until="domcontentloaded")
+            await page.goto(url, wait_until="commit", timeout=15000)
             
-            # Wait for network idle with error handling
-            try:
-                await page.wait_for_load_state("networkidle")
-                logger.debug(f"✅ Page loaded (network idle)")
-            except Exception as e:
-                logger.warning(f"⚠️ Network idle timeout: {str(e)[:100]}")
-                logger.debug(f"⏳ Waiting 5 seconds as fallback...")
-                await page.wait_for_timeout(5000)
-            
-            await page.wait_for_timeout(2000)
+            # Wait for the profile header instead of network idle plus fixed sleeps
+            await page.wait_for_selector("h1", timeout=10000)
+            logger.debug(f"✅ Profile header rendered")
             
         except Exception as e:
             logger.error(f"❌ Error loading profile page: {str(e)}")
             return {}
         
-        logger.debug(f"📄 Parsing profile content...")
-        content = await page.content()
-        soup = BeautifulSoup(content, "html.parser")
-        logger.debug(f"📊 Profile content: {len(content):,} characters")
-        
-        def texts(selector):
-            return [e.get_text(strip=True) for e in soup.select(selector)]
-        
-        def safe(selector):
-            el = soup.select_one(selector)
-            return el.get_text(strip=True) if el else None
-        
-        def multi_safe(selectors):
-            """Try multiple selectors and return first match"""
-            for selector in selectors:
-                result = safe(selector)
-                if result:
-                    return result
-            return None
-        
-        def multi_texts(selectors):
-            """Try multiple selectors and return first non-empty list"""
-            for selector in selectors:
-                result = texts(selector)
-                if result:
-                    return result
-            return []
-        
-        # Get basic doctor information with enhanced selectors
-        doctor_info = {
-            "name": multi_safe([
-                "h1", 
-                ".provider-name", 
-                ".doctor-name", 
-                "[data-testid='provider-name']",
-                ".profile-header h1"
-            ]),
-            "specialty": multi_safe([
-                "div.Specialty", 
-                ".specialty", 
-                "[data-testid='specialty']",
-                ".provider-specialty",
-                ".doctor-specialty",
-                ".profile-specialty"
-            ]),
-            "addresses": multi_texts([
-                "address",
-                ".address",
-                "[data-testid='address']",
-                ".provider-address",
-                ".location-address"
-            ]),
-            "phones": multi_texts([
-                "a[href^='tel']",
-                ".phone",
-                "[data-testid='phone']",
-                ".provider-phone",
-                ".contact-phone"
-            ]),
-            "insurance_accepted": multi_texts([
-                "li[data-testid='insurance-item']",
-                ".insurance-item",
-                ".insurance-plan",
-                ".accepted-insurance li",
-                ".insurance-list li"
-            ]),
-            "languages": multi_texts([
-                "li[data-testid='language-item']",
-                ".language-item",
-                ".languages li",
-                ".provider-languages li"
-            ]),
-            "rating": multi_safe([
-                "span.RatingValue",
-                ".rating-value",
-                "[data-testid='rating']",
-                ".provider-rating",
-                ".star-rating"
-            ]),        }
+        # Extract every field inside the browser instead of serializing the whole DOM back
+        logger.debug(f"📄 Extracting profile fields...")
+        doctor_info = await page.evaluate(_EXTRACT_PROFILE_JS, _PROFILE_FIELDS)
         
         # Log extracted basic information
         logger.info(f"")
@@ -912,32 +1550,20 @@ class DoctorInfoScraper:
         logger.info(f"   • Insurance (from page): {len(doctor_info['insurance_accepted'])} plans found")
         if doctor_info['insurance_accepted']:
             logger.debug(f"      Initial insurance: {doctor_info['insurance_accepted'][:3]}...")
-          # Check insurance acceptance dynamically using parallel tabs (5 insurance plans)
+        
+        # Check insurance acceptance dynamically on the already-loaded profile page (5 insurance plans)
         insurance_plans_to_check = ["Aetna", "Blue Cross Blue Shield", "Cigna", "UnitedHealthcare", "Humana"]
         verified_insurance = []
         
         logger.info(f"")
-        logger.info(f"🏥 DYNAMIC INSURANCE VERIFICATION (checking {len(insurance_plans_to_check)} plans in parallel)")
+        logger.info(f"🏥 DYNAMIC INSURANCE VERIFICATION (checking {len(insurance_plans_to_check)} plans on up to {INSURANCE_CHECK_PAGES} pages)")
         logger.info(f"{'='*60}")
         
-        # Create parallel tasks for checking all 5 insurance plans at once
-        context = page.context
-        insurance_check_tasks = []
-        
-        for insurance in insurance_plans_to_check:
-            insurance_check_tasks.append(
-                self._check_insurance_in_new_tab(context, url, insurance)
-            )
-        
-        # Execute all insurance checks in parallel
-        logger.info(f"🚀 Launching {len(insurance_plans_to_check)} parallel insurance verification tabs...")
-        insurance_results = await asyncio.gather(*insurance_check_tasks, return_exceptions=True)
+        insurance_results = await self._check_insurances_parallel(page, url, insurance_plans_to_check)
         
         # Process results
-        for i, (insurance, result) in enumerate(zip(insurance_plans_to_check, insurance_results)):
-            if isinstance(result, Exception):
-                logger.error(f"   ⚠️ Error checking {insurance}: {str(result)[:100]}")
-            elif result:
+        for insurance in insurance_plans_to_check:
+            if insurance_results.get(insurance):
                 verified_insurance.append(insurance)
                 logger.info(f"   ✅ {insurance} - ACCEPTED")
             else:
@@ -959,334 +1585,197 @@ class DoctorInfoScraper:
         
         return doctor_info
     
-    async def _check_insurance_in_new_tab(self, context, url: str, insurance_name: str) -> bool:
+    async def _check_insurances_parallel(self, page, url: str, insurance_names: List[str]) -> Dict[str, bool]:
+        """
+        Split the carriers across up to INSURANCE_CHECK_PAGES pages and check them concurrently
+        
+        The first share runs on the already-loaded profile page; each extra page
+        loads the profile once and then checks its own share serially.
         """
-        Check insurance acceptance in a new tab/page for parallel processing
+        workers = max(1, min(INSURANCE_CHECK_PAGES, len(insurance_names)))
+        shares = [insurance_names[i::workers] for i in range(workers)]
+        
+        extra_pages = []
+        try:
+            for _ in range(workers - 1):
+                extra_pages.append(await page.context.new_page())
+            
+            logger.info(f"🚀 Checking {len(insurance_names)} plans on {workers} pages...")
+            share_results = await asyncio.gather(*(
+                self._check_insurances_single_page(worker_page, url, share)
+                for worker_page, share in zip([page, *extra_pages], shares)
+            ))
+        finally:
+            for extra_page in extra_pages:
+                try:
+                    await extra_page.close()
+                except Exception:
+                    pass
+        
+        results = {}
+        for share_result in share_results:
+            results.update(share_result)
+        return results
+    
+    async def _check_insurances_single_page(self, page, url: str, insurance_names: List[str]) -> Dict[str, bool]:
+        """
+        Check several insurance carriers one after another on a single profile page
+        
+        The profile is loaded and scrolled once; each carrier is then typed into the
+        same insurance search input, so only one navigation is needed per doctor.
         
         Args:
-            context: Browser context to create new page in
+            page: Page showing (or to be navigated to) the doctor profile
             url: Doctor profile URL
-            insurance_name: Name of insurance to check
+            insurance_names: Names of insurance carriers to check
             
         Returns:
-            bool: True if insurance is accepted, False otherwise
+            Dict[str, bool]: Carrier name -> True if accepted, False otherwise
         """
-        new_page = None
+        results = {insurance_name: False for insurance_name in insurance_names}
         try:
-            # Create a new page for this insurance check
-            new_page = await context.new_page()
+            # The overview scrape normally leaves the page on the profile already
+            if page.url.partition("?")[0] != url:
+                await page.goto(url, wait_until="commit", timeout=15000)
+                await page.wait_for_selector("h1", timeout=10000)
             
-            logger.debug(f"      🔍 [{insurance_name}] Opening new tab...")
-            
-            # Navigate to the doctor profile page
-            await new_page.goto(url, wait_until="domcontentloaded")
-            
-            # Wait for page to be stable
-            try:
-                await new_page.wait_for_load_state("networkidle", timeout=5000)
-            except:
-                await new_page.wait_for_timeout(3000)
-            
-            # Scroll to find the insurance section
-            logger.debug(f"      🔍 [{insurance_name}] Scrolling to insurance section...")
-            await new_page.evaluate("window.scrollTo(0, 0)")
-            await new_page.wait_for_timeout(500)
-            
-            # Scroll down to find INSURANCE PLANS ACCEPTED section
-            insurance_section_found = False
-            for scroll_step in range(1, 8):
-                await new_page.evaluate(f"window.scrollTo(0, document.body.scrollHeight * {scroll_step / 8})")
-                await new_page.wait_for_timeout(800)
-                
-                try:
-                    insurance_text = new_page.locator("text='INSURANCE PLANS ACCEPTED'").first
-                    if await insurance_text.is_visible():
-                        insurance_section_found = True
-                        logger.debug(f"      ✅ [{insurance_name}] Found insurance section")
-                        break
-                except:
-                    continue
+            # Jump straight to the INSURANCE PLANS ACCEPTED section
+            logger.debug(f"      🔍 Scrolling to insurance section...")
+            insurance_section_found = await self._scroll_to_insurance_section(page)
             
             if not insurance_section_found:
-                logger.debug(f"      ⚠️ [{insurance_name}] Insurance section not clearly visible")
+                logger.debug(f"      ⚠️ Insurance section not clearly visible")
             
             # Try to find the insurance input field
-            logger.debug(f"      🔍 [{insurance_name}] Looking for search input...")
-            search_input_xpath = "/html/body/div[1]/main/div[4]/div[19]/div/div[2]/div/div/div[1]/div/div/div[1]/div[1]/input"
-            
-            try:
-                search_input = new_page.locator(f"xpath={search_input_xpath}")
-                await search_input.wait_for(state="visible", timeout=5000)
-            except:
-                # Try fallback selector
-                try:
-                    search_input = new_page.locator('input.webmd-input__inner[placeholder="Enter Insurance Carrier"]').first
-                    await search_input.wait_for(state="visible", timeout=5000)
-                except:
-                    logger.debug(f"      ❌ [{insurance_name}] Input field not found")
-                    return False
-            
-            # Enter insurance name
-            logger.debug(f"      ⌨️ [{insurance_name}] Entering insurance name...")
-            await search_input.click()
-            await new_page.wait_for_timeout(300)
-            await search_input.fill("")
-            await new_page.wait_for_timeout(200)
-            await search_input.type(insurance_name, delay=50)
-            await new_page.wait_for_timeout(800)
+            logger.debug(f"      🔍 Looking for search input...")
+            search_input = await _find_visible_locator(page, "input", _INSURANCE_INPUT_SELECTORS)
+            if search_input is None:
+                logger.debug(f"      ❌ Input field not found")
+                return results
             
-            # Click the apply/search button
-            logger.debug(f"      🖱️ [{insurance_name}] Clicking search button...")
-            button_xpath = "//*[@id='insurance']/div/div[2]/div/div/div[1]/div/div/div[3]/button"
-            
-            try:
-                apply_button = new_page.locator(f"xpath={button_xpath}")
-                await apply_button.wait_for(state="visible", timeout=5000)
-                await apply_button.click()
-            except:
-                # Fallback: press Enter
+            for insurance_name in insurance_names:
                 try:
-                    await search_input.press("Enter")
-                except:
-                    logger.debug(f"      ❌ [{insurance_name}] Could not trigger search")
-                    return False
-            
-            # Wait for results
-            await new_page.wait_for_timeout(2000)
-            
-            try:
-                await new_page.wait_for_load_state("networkidle", timeout=5000)
-            except:
-                await new_page.wait_for_timeout(1000)
-            
-            # Check for verification text
-            logger.debug(f"      🔍 [{insurance_name}] Analyzing results...")
-            
-            # Check for positive verification
-            verify_text_selector = "div.verify-text"
-            verify_elements = new_page.locator(verify_text_selector)
-            
-            if await verify_elements.count() > 0:
-                for i in range(await verify_elements.count()):
-                    verify_text = await verify_elements.nth(i).text_content()
-                    if verify_text and "accepts" in verify_text.lower() and insurance_name.lower() in verify_text.lower():
-                        logger.debug(f"      ✅ [{insurance_name}] ACCEPTED - verification found!")
-                        return True
-            
-            # Check page content for acceptance patterns
-            page_content = (await new_page.content()).lower()
-            
-            acceptance_patterns = [
-                f"dr.*accepts.*{insurance_name.lower()}",
-                f"accepts.*{insurance_name.lower()}",
-                f"{insurance_name.lower()}.*accepted",
-                f"{insurance_name.lower()}.*participating"
-            ]
-            
-            for pattern in acceptance_patterns:
-                if re.search(pattern, page_content, re.IGNORECASE):
-                    logger.debug(f"      ✅ [{insurance_name}] ACCEPTED - pattern match!")
-                    return True
-            
-            # Check for rejection patterns
-            rejection_patterns = [
-                "we cannot verify",
-                "cannot verify",
-                "not verified",
-                "contact.*provider.*to confirm"
-            ]
-            
-            for pattern in rejection_patterns:
-                if re.search(pattern, page_content, re.IGNORECASE):
-                    logger.debug(f"      ❌ [{insurance_name}] NOT VERIFIED")
-                    return False
-            
-            logger.debug(f"      ⚠️ [{insurance_name}] No clear result")
-            return False
+                    results[insurance_name] = await self._check_insurance_on_page(page, search_input, insurance_name)
+                except Exception as e:
+                    logger.debug(f"      ❌ [{insurance_name}] Exception: {str(e)[:100]}")
+                # Clear the widget in place rather than reloading the profile for the next carrier
+                await self._reset_insurance_widget(page)
             
         except Exception as e:
-            logger.debug(f"      ❌ [{insurance_name}] Exception: {str(e)[:100]}")
+            logger.debug(f"      ❌ Insurance verification failed: {str(e)[:100]}")
+        
+        return results
+    
+    async def _reset_insurance_widget(self, page) -> None:
+        """Empty the insurance search input and dismiss the previous verdict, if a close control exists"""
+        try:
+            await page.evaluate(_RESET_INSURANCE_INPUT_JS)
+            close_button = page.locator("button.close-verify, button.webmd-input__close").first
+            if await close_button.count():
+                await close_button.click(timeout=1000)
+        except Exception as e:
+            logger.debug(f"      ⚠️ Could not reset insurance widget: {str(e)[:100]}")
+    
+    async def _scroll_to_insurance_section(self, page) -> bool:
+        """Scroll the INSURANCE PLANS ACCEPTED heading into view; returns False if it never appears"""
+        insurance_text = page.get_by_text("INSURANCE PLANS ACCEPTED").first
+        try:
+            await insurance_text.scroll_into_view_if_needed(timeout=8000)
+            return True
+        except Exception:
+            pass
+        
+        # The section may only render once the lower page is reached; try once from the bottom
+        try:
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            await insurance_text.scroll_into_view_if_needed(timeout=3000)
+            return True
+        except Exception:
             return False
-        finally:
-            # Always close the tab to free resources
-            if new_page:
-                try:
-                    await new_page.close()
-                except:
-                    pass
     
-    async def _check_insurance_acceptance(self, page, insurance_name: str = "Aetna") -> bool:
-        """
-        Check if a doctor accepts a specific insurance using the exact logic from reference
-        """
+    async def _check_insurance_on_page(self, page, search_input, insurance_name: str) -> bool:
+        """Search one carrier in the profile's insurance widget and classify the result"""
+        # The previous carrier's verdict can still be in the DOM; remember it so it is not mistaken for this one
+        previous_texts = [text.strip() for text in await page.locator("div.verify-text").all_text_contents()]
+        
+        # Enter insurance name; fill() replaces whatever the previous check entered
+        logger.debug(f"      ⌨️ [{insurance_name}] Entering insurance name...")
+        await search_input.fill(insurance_name)
         try:
-            logger.debug(f"      → Verifying {insurance_name}...")
-            
-            # Wait for page to be stable
+            # Let the widget's suggestion list/debounce settle instead of sleeping
+            await page.wait_for_selector(".webmd-input__suggestions", timeout=2500, state="attached")
+        except PlaywrightTimeoutError:
+            pass
+        
+        # Snapshot the verdict mutation count right before submitting
+        mutations_before = await page.evaluate(_WATCH_VERIFY_TEXT_JS)
+        
+        # Click the apply/search button
+        logger.debug(f"      🖱️ [{insurance_name}] Clicking search button...")
+        
+        try:
+            apply_button = await _find_visible_locator(page, "button", _INSURANCE_BUTTON_SELECTORS)
+            if apply_button is None:
+                raise LookupError("apply button not found")
+            await apply_button.click()
+        except:
+            # Fallback: press Enter
             try:
-                await page.wait_for_load_state("networkidle")
+                await search_input.press("Enter")
             except:
-                pass
-            await page.wait_for_timeout(2000)
-            
-            # Scroll to find the insurance section
-            logger.debug(f"      → Scrolling to find insurance section...")
-            await page.evaluate("window.scrollTo(0, 0)")  # Start at top
-            await page.wait_for_timeout(500)
-            
-            # Scroll down to find the INSURANCE PLANS ACCEPTED section
-            insurance_section_found = False
-            for scroll_step in range(1, 8):
-                await page.evaluate(f"window.scrollTo(0, document.body.scrollHeight * {scroll_step / 8})")
-                await page.wait_for_timeout(1000)
-                
-                # Check if we can see "INSURANCE PLANS ACCEPTED" text
-                try:
-                    insurance_text = page.locator("text='INSURANCE PLANS ACCEPTED'").first
-                    if await insurance_text.is_visible():
-                        insurance_section_found = True
-                        logger.debug(f"      → Found insurance section at scroll {scroll_step}/7")
-                        break
-                except:
-                    continue
-            
-            if not insurance_section_found:
-                logger.debug(f"      → Insurance section not clearly visible, continuing anyway...")
-            
-            # Use the exact XPath from reference code
-            logger.debug(f"      → Looking for insurance input field...")
-            search_input_xpath = "/html/body/div[1]/main/div[4]/div[19]/div/div[2]/div/div/div[1]/div/div/div[1]/div[1]/input"
-            try:
-                # Wait for the specific input field to be visible
-                search_input = page.locator(f"xpath={search_input_xpath}")
-                await search_input.wait_for(state="visible", timeout=5000)
-                
-                placeholder = await search_input.get_attribute('placeholder') or ""
-                logger.debug(f"      → Found input field (placeholder: '{placeholder}')")
-                
-            except Exception as e:
-                # Fallback to class-based selector if XPath fails
-                logger.debug(f"      → XPath failed, trying fallback selector...")
-                try:
-                    search_input = page.locator('input.webmd-input__inner[placeholder="Enter Insurance Carrier"]').first
-                    await search_input.wait_for(state="visible", timeout=5000)
-                    logger.debug(f"      → Found input using fallback selector")
-                except:
-                    logger.debug(f"      → Input field not found: {str(e)[:100]}")
-                    return False
-            
-            # Clear any existing text and enter insurance name
-            logger.debug(f"      → Entering '{insurance_name}' in search field...")
-            try:
-                # Click to focus the input
-                await search_input.click()
-                await page.wait_for_timeout(500)
-                
-                # Clear existing text
-                await search_input.fill("")
-                await page.wait_for_timeout(300)                
-                # Type the insurance name
-                await search_input.type(insurance_name, delay=100)
-                await page.wait_for_timeout(1000)
-                
-                logger.debug(f"      → Successfully entered text")
-                
-            except Exception as e:
-                logger.debug(f"      → Failed to enter insurance name: {str(e)[:100]}")
+                logger.debug(f"      ❌ [{insurance_name}] Could not trigger search")
                 return False
-            
-            # Use the exact XPath for button from reference
-            logger.debug(f"      → Clicking apply/search button...")
-            button_xpath = "//*[@id='insurance']/div/div[2]/div/div/div[1]/div/div/div[3]/button"
-            
-            try:
-                # Wait for and click the specific button
-                apply_button = page.locator(f"xpath={button_xpath}")
-                await apply_button.wait_for(state="visible", timeout=5000)
-                await apply_button.click()
-                
-                logger.debug(f"      → Button clicked")
-                
-            except Exception as e:
-                # Fallback: try pressing Enter on the input field
-                logger.debug(f"      → Button failed, trying Enter key...")
-                try:
-                    await search_input.press("Enter")
-                    logger.debug(f"      → Used Enter key")
-                except Exception as enter_error:
-                    logger.debug(f"      → Both methods failed: {str(e)[:100]}")
-                    return False
-            
-            # Wait 2 seconds as requested
-            await page.wait_for_timeout(2000)
-            
-            # Wait for any loading to complete
-            logger.debug(f"      → Waiting for results...")
-            try:
-                await page.wait_for_load_state("networkidle", timeout=5000)
-            except:
-                await page.wait_for_timeout(1000)  # Fallback wait
-              # Look for the specific verification text
-            logger.debug(f"      → Analyzing verification result...")
+        
+        insurance_lower = insurance_name.lower()
+        
+        # Wait for a verdict for this carrier: a re-rendered verify-text, or one that newly names it
+        try:
+            await page.wait_for_function(
+                _VERIFY_TEXT_UPDATED_JS, arg=[mutations_before, insurance_lower, previous_texts], timeout=5000
+            )
+        except PlaywrightTimeoutError:
+            # No fresh verdict yet; give the widget's request a moment to settle
             try:
-                # Check for the positive verification message
-                verify_text_selector = "div.verify-text"
-                verify_elements = page.locator(verify_text_selector)
-                if await verify_elements.count() > 0:
-                    for i in range(await verify_elements.count()):
-                        verify_text = await verify_elements.nth(i).text_content()
-                        if verify_text:
-                            logger.debug(f"      → Found verify text: '{verify_text[:100]}'")
-                            
-                            # Check if it matches the pattern "Dr. [Name], accepts [Insurance]."
-                            if ("accepts" in verify_text.lower() and 
-                                insurance_name.lower() in verify_text.lower()):
-                                logger.debug(f"      ✅ ACCEPTED (verification found)")
-                                return True
-                
-                # Also check for any div containing acceptance text
-                page_content = (await page.content()).lower()
-                
-                # Look for positive acceptance patterns
-                acceptance_patterns = [
-                    f"dr.*accepts.*{insurance_name.lower()}",
-                    f"accepts.*{insurance_name.lower()}",
-                    f"{insurance_name.lower()}.*accepted",
-                    f"{insurance_name.lower()}.*participating"
-                ]
-                
-                for pattern in acceptance_patterns:
-                    if re.search(pattern, page_content, re.IGNORECASE):
-                        logger.debug(f"      ✅ ACCEPTED (pattern match: {pattern})")
-                        return True
-                
-                # Check for rejection/cannot verify patterns
-                rejection_patterns = [
-                    "we cannot verify",
-                    "cannot verify", 
-                    "not verified",
-                    "contact.*provider.*to confirm",
-                    "you should contact the provider"
-                ]
-                
-                for pattern in rejection_patterns:
-                    if re.search(pattern, page_content, re.IGNORECASE):
-                        logger.debug(f"      ❌ NOT VERIFIED (rejection: {pattern})")
-                        return False
-                
-                # If no clear acceptance or rejection found
-                logger.debug(f"      ⚠️ No clear verification result")
-                return False
-                
-            except Exception as e:
-                logger.debug(f"      ⚠️ Error checking result: {str(e)[:100]}")
+                await page.wait_for_load_state("networkidle", timeout=3000)
+            except PlaywrightTimeoutError:
+                pass
+        
+        # Check for verification text
+        logger.debug(f"      🔍 [{insurance_name}] Analyzing results...")
+        acceptance_re, rejection_re = _get_patterns(insurance_name)
+        
+        # Only verification text that names this carrier is trusted; anything else may be a stale verdict
+        verify_texts = [
+            text.lower() for text in await page.locator("div.verify-text").all_text_contents()
+            if text and insurance_lower in text.lower()
+        ]
+        if verify_texts:
+            if any("accepts" in text and insurance_lower in text for text in verify_texts):
+                logger.debug(f"      ✅ [{insurance_name}] ACCEPTED - verification found!")
+                return True
+            if any(rejection_re.search(text) for text in verify_texts):
+                logger.debug(f"      ❌ [{insurance_name}] NOT VERIFIED")
                 return False
-            
-        except Exception as e:
-            logger.debug(f"      ❌ Exception: {str(e)[:100]}")
+        
+        # Last resort: check page text (tags stripped) for acceptance patterns
+        page_content = await page.content()
+        stripped = _TAG_RE.sub(" ", page_content).lower()
+        
+        # The acceptance pattern needs the carrier and one of its verbs; skip the scan when either is absent
+        if insurance_lower in stripped and ("accept" in stripped or "participating" in stripped):
+            if acceptance_re.search(stripped):
+                logger.debug(f"      ✅ [{insurance_name}] ACCEPTED - pattern match!")
+                return True
+        
+        # Check for rejection phrases
+        if rejection_re.search(stripped):
+            logger.debug(f"      ❌ [{insurance_name}] NOT VERIFIED")
             return False
+        
+        logger.debug(f"      ⚠️ [{insurance_name}] No clear result")
+        return False
     
-    def _search_google_places(self, name: str, specialty: str) -> Dict:
+    async def _search_google_places(self, client: "httpx.AsyncClient", name: str, specialty: str, address: str = None) -> Dict:
         """
         Search Google Places for practice information
         Requires GOOGLE_PLACES_API_KEY environment variable
@@ -1308,90 +1797,162 @@ class DoctorInfoScraper:
                 logger.info("Google Places search skipped (API key required)")
                 return google_info
             
-            search_query = f"Dr {name} {specialty}"
-            logger.info(f"Google Places search query: {search_query}")
-            
-            # Step 1: Text Search to find place candidates
-            text_search_url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
-            text_params = {
-                'query': search_query,
-                'key': api_key,
-                'type': 'doctor'
-            }
+            # Step 1: Text Search to find the place
+            place_id = await self._find_place_id(client, api_key, name, specialty)
             
-            response = self.session.get(text_search_url, params=text_params, timeout=10)
+            # Text Search often misses individual doctors; retry around the known address
+            if not place_id and address:
+                location = await self._geocode(address)
+                if location.get("lat") is not None:
+                    place_id = await self._places_nearby(client, api_key, name, location["lat"], location["lng"])
             
-            if response.status_code == 200:
-                data = response.json()
-                
-                if data.get('status') == 'OK' and data.get('results'):
-                    # Get the first result
-                    place = data['results'][0]
-                    place_id = place.get('place_id')
+            # Step 2: Place Details to get comprehensive information
+            if place_id:
+                result = await self._get_place_details(client, api_key, place_id)
+                if result:
+                    google_info.update({
+                        "address": result.get('formatted_address'),
+                        "phone_number": result.get('formatted_phone_number'),
+                        "google_rating": result.get('rating'),
+                        "website": result.get('website'),
+                        "business_hours": result.get('opening_hours', {}).get('weekday_text', [])
+                    })
                     
-                    # Step 2: Place Details to get comprehensive information
-                    if place_id:
-                        details_url = "https://maps.googleapis.com/maps/api/place/details/json"
-                        details_params = {
-                            'place_id': place_id,
-                            'key': api_key,
-                            'fields': 'name,formatted_address,formatted_phone_number,rating,reviews,website,opening_hours'
+                    # Extract reviews
+                    reviews = result.get('reviews', [])
+                    google_info["google_reviews"] = [
+                        {
+                            "author": review.get('author_name'),
+                            "rating": review.get('rating'),
+                            "text": review.get('text'),
+                            "time": review.get('time')
                         }
-                        
-                        details_response = self.session.get(details_url, params=details_params, timeout=10)
-                        
-                        if details_response.status_code == 200:
-                            details_data = details_response.json()
-                            
-                            if details_data.get('status') == 'OK':
-                                result = details_data.get('result', {})
-                                
-                                google_info.update({
-                                    "address": result.get('formatted_address'),
-                                    "phone_number": result.get('formatted_phone_number'),
-                                    "google_rating": result.get('rating'),
-                                    "website": result.get('website'),
-                                    "business_hours": result.get('opening_hours', {}).get('weekday_text', [])
-                                })
-                                
-                                # Extract reviews
-                                reviews = result.get('reviews', [])
-                                google_info["google_reviews"] = [
-                                    {
-                                        "author": review.get('author_name'),
-                                        "rating": review.get('rating'),
-                                        "text": review.get('text'),
-                                        "time": review.get('time')
-                                    }
-                                    for review in reviews[:5]  # Limit to 5 reviews
-                                ]
-                                
-                                # Create practice location
-                                if result.get('formatted_address'):
-                                    location = {
-                                        "address": result.get('formatted_address'),
-                                        "phone": result.get('formatted_phone_number'),
-                                        "rating": result.get('rating'),
-                                        "source": "Google Places"
-                                    }
-                                    google_info["practice_locations"].append(location)
-                                
-                                logger.info(f"Google Places data found: Rating {result.get('rating')}, Reviews: {len(reviews)}")
-                            else:
-                                logger.warning(f"Google Places Details API error: {details_data.get('status')}")
-                    else:
-                        logger.warning("No place_id found in Google Places search")
-                else:
-                    logger.info(f"Google Places search returned no results for: {search_query}")
-            else:
-                logger.error(f"Google Places API request failed: {response.status_code}")
+                        for review in reviews[:5]  # Limit to 5 reviews
+                    ]
+                    
+                    # Create practice location
+                    if result.get('formatted_address'):
+                        location = {
+                            "address": result.get('formatted_address'),
+                            "phone": result.get('formatted_phone_number'),
+                            "rating": result.get('rating'),
+                            "source": "Google Places"
+                        }
+                        google_info["practice_locations"].append(location)
+                    
+                    logger.info(f"Google Places data found: Rating {result.get('rating')}, Reviews: {len(reviews)}")
                 
         except Exception as e:
             logger.error(f"Google Places search error: {str(e)}")
             
         return google_info
     
-    def _search_medical_board(self, name: str, specialty: str) -> Dict:
+    async def _find_place_id(self, client: "httpx.AsyncClient", api_key: str, name: str, specialty: str) -> Optional[str]:
+        """Run a Places Text Search and return the first place_id (cached for PLACES_TTL)"""
+        cache_key = (name.lower().strip(), specialty.lower().strip())
+        place_id = _PLACES_TEXT_CACHE.get(cache_key)
+        if place_id:
+            logger.info(f"Google Places text search cache hit for: {name}")
+            return place_id
+        
+        # Concurrent lookups for the same doctor share one request
+        return await _coalesced(
+            ("places-text", *cache_key),
+            lambda: self._fetch_place_id(client, api_key, name, specialty, cache_key),
+        )
+    
+    async def _fetch_place_id(self, client: "httpx.AsyncClient", api_key: str, name: str, specialty: str,
+                              cache_key: Tuple[str, str]) -> Optional[str]:
+        search_query = f"Dr {name} {specialty}"
+        logger.info(f"Google Places search query: {search_query}")
+        
+        text_search_url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
+        text_params = {
+            'query': search_query,
+            'key': api_key,
+            'type': 'doctor'
+        }
+        
+        response = await _get_with_retries(client, text_search_url, params=text_params, limiter=_PLACES_LIMITER)
+        if response.status_code != 200:
+            logger.error(f"Google Places API request failed: {response.status_code}")
+            return None
+        
+        data = orjson.loads(response.content)
+        if data.get('status') != 'OK' or not data.get('results'):
+            logger.info(f"Google Places search returned no results for: {search_query}")
+            return None
+        
+        # Get the first result
+        place_id = data['results'][0].get('place_id')
+        if not place_id:
+            logger.warning("No place_id found in Google Places search")
+            return None
+        
+        _PLACES_TEXT_CACHE[cache_key] = place_id
+        return place_id
+    
+    async def _places_nearby(self, client: "httpx.AsyncClient", api_key: str, name: str, lat: float, lng: float) -> Optional[str]:
+        """Run a Places Nearby Search for the doctor around (lat, lng) and return the first place_id"""
+        nearby_url = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
+        nearby_params = {
+            'location': f"{lat},{lng}",
+            'radius': 5000,
+            'type': 'doctor',
+            'keyword': name,
+            'key': api_key
+        }
+        
+        response = await _get_with_retries(client, nearby_url, params=nearby_params, limiter=_PLACES_LIMITER)
+        if response.status_code != 200:
+            logger.error(f"Google Places Nearby request failed: {response.status_code}")
+            return None
+        
+        data = orjson.loads(response.content)
+        if data.get('status') != 'OK' or not data.get('results'):
+            logger.info(f"Google Places nearby search returned no results for: {name}")
+            return None
+        
+        place_id = data['results'][0].get('place_id')
+        if place_id:
+            logger.info(f"✅ Google Places nearby search found: {data['results'][0].get('name')}")
+        return place_id
+    
+    async def _get_place_details(self, client: "httpx.AsyncClient", api_key: str, place_id: str) -> Optional[Dict]:
+        """Fetch Place Details for place_id (cached for PLACES_TTL)"""
+        result = _PLACES_DETAILS_CACHE.get(place_id)
+        if result is not None:
+            logger.info(f"Google Places details cache hit for: {place_id}")
+            return result
+        
+        return await _coalesced(
+            ("places-details", place_id),
+            lambda: self._fetch_place_details(client, api_key, place_id),
+        )
+    
+    async def _fetch_place_details(self, client: "httpx.AsyncClient", api_key: str, place_id: str) -> Optional[Dict]:
+        details_url = "https://maps.googleapis.com/maps/api/place/details/json"
+        details_params = {
+            'place_id': place_id,
+            'key': api_key,
+            'fields': 'name,formatted_address,formatted_phone_number,rating,reviews,website,opening_hours'
+        }
+        
+        details_response = await _get_with_retries(client, details_url, params=details_params, limiter=_PLACES_LIMITER)
+        if details_response.status_code != 200:
+            logger.error(f"Google Places Details request failed: {details_response.status_code}")
+            return None
+        
+        details_data = orjson.loads(details_response.content)
+        if details_data.get('status') != 'OK':
+            logger.warning(f"Google Places Details API error: {details_data.get('status')}")
+            return None
+        
+        result = details_data.get('result', {})
+        _PLACES_DETAILS_CACHE[place_id] = result
+        return result
+    
+    async def _search_medical_board(self, client: "httpx.AsyncClient", name: str, specialty: str) -> Dict:
         """
         Search state medical board for license information
         This is a generic implementation - would need state-specific logic
@@ -1420,6 +1981,22 @@ class DoctorInfoScraper:
             
         return license_info
 
+@alru_cache(maxsize=1024, ttl=WEBMD_OVERVIEW_TTL)
+async def _fetch_doctor_overview(url: str) -> Dict:
+    """
+    Scrape a WebMD profile in a pooled context, memoized by URL for WEBMD_OVERVIEW_TTL seconds
+    
+    Runs on _LOOP; failed scrapes (empty results) are evicted so they are retried.
+    """
+    # The context goes back to the pool afterwards; the browser stays up for the next call
+    async with _BROWSER_POOL.context() as context:
+        page = await context.new_page()
+        details = await DoctorInfoScraper()._scrape_doctor_overview(page, url)
+    
+    if not details:
+        _fetch_doctor_overview.cache_invalidate(url)
+    return details
+
 def search_doctor_info(name: str, specialty: str, address: str = None) -> Dict:
     """
     Convenience function to search for doctor information
@@ -1435,6 +2012,36 @@ def search_doctor_info(name: str, specialty: str, address: str = None) -> Dict:
     scraper = DoctorInfoScraper()
     return scraper.get_doctor_details(name, specialty, address)
 
+async def search_doctor_info_async(name: str, specialty: str, address: str = None) -> Dict:
+    """
+    Async variant of search_doctor_info for callers already inside an event loop
+    
+    Args:
+        name (str): Doctor's full name
+        specialty (str): Doctor's specialty
+        address (str, optional): Doctor's address for better WebMD searching
+        
+    Returns:
+        Dict: Comprehensive doctor information
+    """
+    scraper = DoctorInfoScraper()
+    return await scraper.get_doctor_details_async(name, specialty, address)
+
+async def check_npi_registry_async() -> bool:
+    """
+    Probe the live NPI Registry, bypassing the response cache
+    
+    Runs on the shared scraper loop (which owns the HTTP client and rate limiters)
+    and can be awaited from any event loop.
+    
+    Returns:
+        bool: True if the registry answered with a usable result
+    """
+    async def probe() -> Dict:
+        return await DoctorInfoScraper()._fetch_npi_registry(_get_http_client(), "Test", "Internal Medicine")
+    
+    return bool(await asyncio.wrap_future(_submit(probe())))
+
 def demo_doctor_search():
     """
     Demo function to test the doctor search functionality
@@ -1448,37 +2055,42 @@ def demo_doctor_search():
     
     print("=== Doctor Information Scraper Demo ===")
     
-    for test_case in test_cases:
+    async def run_all():
+        # The lookups are independent, so let their network waits overlap
+        return await asyncio.gather(
+            *(search_doctor_info_async(**test_case) for test_case in test_cases),
+            return_exceptions=True,
+        )
+    
+    results = asyncio.run(run_all())
+    
+    for test_case, result in zip(test_cases, results):
         print(f"\n🔍 Searching for: Dr. {test_case['name']} - {test_case['specialty']}")
         print("-" * 60)
         
-        try:
-            result = search_doctor_info(test_case['name'], test_case['specialty'])
+        if isinstance(result, BaseException):
+            logger.error(f"Error searching for {test_case['name']}: {str(result)}")            
+            print(f"   ❌ Search failed: {str(result)}")
+            continue
+        
+        print(f"📊 Search Results:")
+        print(f"   Name: {result['name']}")
+        print(f"   Specialty: {result['specialty']}")
+        print(f"   Sources Found: {', '.join(result['scraped_sources'])}")
+        
+        if result['npi_data']:
+            print(f"   NPI Records: {len(result['npi_data'].get('providers', []))}")
             
-            print(f"📊 Search Results:")
-            print(f"   Name: {result['name']}")
-            print(f"   Specialty: {result['specialty']}")
-            print(f"   Sources Found: {', '.join(result['scraped_sources'])}")
+        if result['address']:
+            print(f"   Address: {result['address']}")
             
-            if result['npi_data']:
-                print(f"   NPI Records: {len(result['npi_data'].get('providers', []))}")
-                
-            if result['address']:
-                print(f"   Address: {result['address']}")
-                
-            if result['phone_number']:
-                print(f"   Phone: {result['phone_number']}")
-                
-            if result['services_offered']:
-                print(f"   Services: {', '.join(result['services_offered'])}")
-                
-            print(f"   Full data: {json.dumps(result, indent=2)}")
+        if result['phone_number']:
+            print(f"   Phone: {result['phone_number']}")
             
-        except Exception as e:
-            logger.error(f"Error searching for {test_case['name']}: {str(e)}")            
-            print(f"   ❌ Search failed: {str(e)}")
-        
-        time.sleep(2)  # Rate limiting
+        if result['services_offered']:
+            print(f"   Services: {', '.join(result['services_offered'])}")
+            
+        print(f"   Full data: {orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()}")
 
 if __name__ == "__main__":
     # Run demo
@@ -42,7 +42,7 @@ from config.route_config import (
 
 # Add helpers to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'helpers'))
-from helpers.funtion import search_doctor_info, DoctorInfoScraper
+from helpers.funtion import search_doctor_info_async, check_npi_registry_async
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -681,7 +681,7 @@ async def verify_doctor(request: DoctorVerificationRequest, db: Session = Depend
         
         # Generate verification ID
         verification_id = f"VER_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{hash(request.fullName) % 10000:04d}"          # Search for doctor information
-        scraped_data = search_doctor_info(request.fullName, request.specialty, request.address)
+        scraped_data = await search_doctor_info_async(request.fullName, request.specialty, request.address)
         
         # Log scraped data for debugging
         logger.debug(f"Scraped data for {request.fullName}: {scraped_data.keys() if scraped_data else 'None'}")
@@ -764,7 +764,7 @@ async def search_doctor(request: DoctorSearchRequest):
         search_id = f"SEARCH_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{hash(request.name) % 10000:04d}"
         
         # Search for doctor information
-        search_results = search_doctor_info(request.name, request.specialty or "")
+        search_results = await search_doctor_info_async(request.name, request.specialty or "")
         
         # Format results
         formatted_results = []
@@ -895,7 +895,7 @@ async def extract_provider_from_pdf(file: UploadFile = File(...), db: Session =
                 # Generate verification ID
                 verification_id = f"VER_PDF_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{hash(verification_request.fullName) % 10000:04d}"
                   # Search for doctor information
-                scraped_data = search_doctor_info(
+                scraped_data = await search_doctor_info_async(
                     verification_request.fullName,
                     verification_request.specialty,
                     verification_request.address
@@ -1196,9 +1196,8 @@ def parse_provider_info(text: str) -> Dict[str, str]:
 async def health_check():
     """Health check for doctor verification service"""
     try:
-        # Test NPI API connectivity
-        scraper = DoctorInfoScraper()
-        test_result = scraper._search_npi_registry("Test", "Internal Medicine")
+        # Test NPI API connectivity against the live API, bypassing the response cache
+        test_result = await check_npi_registry_async()
         
         return {
             "status": "healthy",
@@ -1396,7 +1395,7 @@ async def verify_all_doctors(db: Session = Depends(get_db)):
                 
                 # Search for doctor information with timeout handling
                 try:
-                    scraped_data = search_doctor_info(full_name, specialty, report.address_input)
+                    scraped_data = await search_doctor_info_async(full_name, specialty, report.address_input)
                 except Exception as scrape_error:
                     logger.error(f"Scraping error for {full_name}: {str(scrape_error)}")
                     # Continue with empty scraped_data rather than failing completely